@@ -16,15 +16,50 @@
 
 """PDF rasterizer based upon either Xpdf or Poppler."""
 
+import collections
 import os
 import shutil
 import subprocess
 import tempfile
+from typing import IO
 
 from pyzui.tilesystem.tiler.ppm import read_ppm_header
 
 from .converter import Converter
 
+## number of trailing pdftoppm output lines kept for the error message
+_MAX_OUTPUT_LINES = 20
+
+## most pdftoppm processes run for one document, each rasterizing its own
+## contiguous range of pages; kept small because the conversion itself
+## already runs in one of converterrunner's pool workers
+_MAX_SHARDS = 4
+
+
+def _count_pages(infile: str) -> int:
+    """
+    Function :
+        _count_pages(infile)
+    Parameters :
+        infile : str
+
+    _count_pages(infile) --> int
+
+    Return the number of pages pdfinfo reports for the PDF `infile`, or 0 if
+    pdfinfo is unavailable or cannot read the file.
+    """
+    try:
+        result = subprocess.run(["pdfinfo", infile], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False)
+    except OSError:
+        return 0
+
+    for line in result.stdout.splitlines():
+        if line.startswith(b"Pages:"):
+            pages = line[6:].strip()
+            return int(pages) if pages.isdigit() else 0
+
+    return 0
+
 
 class PDFConverter(Converter):
     """
@@ -132,37 +167,83 @@ class PDFConverter(Converter):
         calls pdftoppm to rasterize the PDF into individual PPM pages, then
         merges the pages into a single PPM file.
 
+        When pdfinfo reports more than one page, the pages are split into
+        contiguous ranges rasterized by concurrent pdftoppm processes, at
+        most `_MAX_SHARDS` of them.
+
         If any errors are encountered then :attr:`self.error` will be set to a
         string describing the error.
         """
         tmpdir = tempfile.mkdtemp()
-        self._logger.info("calling pdftoppm")
-        process = subprocess.Popen(
-            ["pdftoppm", "-r", str(self.resolution), self._infile, os.path.join(tmpdir, "page")],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
-        stdout = process.communicate()[0]
-
-        if process.returncode == 0:
-            try:
-                self.__merge(tmpdir)
+        num_pages = _count_pages(self._infile)
+        shards = max(1, min(_MAX_SHARDS, num_pages))
+        if shards == 1:
+            page_ranges: list[list[str]] = [[]]
+        else:
+            page_ranges = [
+                ["-f", str(i * num_pages // shards + 1), "-l", str((i + 1) * num_pages // shards)]
+                for i in range(shards)
+            ]
+
+        ## each process writes its output to its own temporary file rather
+        ## than a pipe, so a chatty process never blocks on a full pipe while
+        ## an earlier one is being waited on; a damaged PDF can make pdftoppm
+        ## print a warning for every broken object, and only the last lines
+        ## are kept to describe a failure
+        logs: list[IO[bytes]] = []
+        processes: list[subprocess.Popen[bytes]] = []
+        try:
+            self._logger.info(f"calling pdftoppm on {shards} page range(s)")
+            for pages in page_ranges:
+                logs.append(tempfile.TemporaryFile())
+                processes.append(
+                    subprocess.Popen(
+                        ["pdftoppm", "-r", str(self.resolution), *pages, self._infile, os.path.join(tmpdir, "page")],
+                        stdout=logs[-1],
+                        stderr=subprocess.STDOUT,
+                    )
+                )
+
+            returncode = 0
+            stdout = b""
+            for process, log in zip(processes, logs, strict=True):
+                code = process.wait()
+                ## report the first process that failed
+                if code != 0 and returncode == 0:
+                    log.seek(0)
+                    returncode, stdout = code, b"".join(collections.deque(log, maxlen=_MAX_OUTPUT_LINES))
+
+            if returncode == 0:
+                try:
+                    self.__merge(tmpdir)
 
-            except Exception as e:
-                self.error = "Error in PDFConverter.__merge() \n" + str(e)  # type: ignore[assignment]
-                self._logger.error(self.error)
+                except Exception as e:
+                    self.error = "Error in PDFConverter.__merge() \n" + str(e)  # type: ignore[assignment]
+                    self._logger.error(self.error)
 
-                try:
-                    os.unlink(self._outfile)
-                except Exception:
-                    self._logger.exception(f"unable to unlink temporary file '{self._outfile}'")
+                    try:
+                        os.unlink(self._outfile)
+                    except Exception:
+                        self._logger.exception(f"unable to unlink temporary file '{self._outfile}'")
 
-        else:
-            self.error = f"conversion failed with return code {process.returncode}:\n{stdout!r}"  # type: ignore[assignment]
+            else:
+                self.error = f"conversion failed with return code {returncode}:\n{stdout!r}"  # type: ignore[assignment]
+                self._logger.error(self.error)
+
+        except OSError as e:
+            self.error = f"unable to run pdftoppm: {e!s}"  # type: ignore[assignment]
             self._logger.error(self.error)
 
-        shutil.rmtree(tmpdir, ignore_errors=True)
-        self._progress = 1.0
+        finally:
+            ## never leave a pdftoppm running or its page files behind
+            for process in processes:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+            for log in logs:
+                log.close()
+            shutil.rmtree(tmpdir, ignore_errors=True)
+            self._progress = 1.0
 
     def __str__(self) -> str:
         """
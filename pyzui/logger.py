@@ -16,11 +16,13 @@
 
 """Centralized logging configuration for PyZUI."""
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 
 class LoggerConfig:
@@ -37,7 +39,7 @@ class LoggerConfig:
     Provides consistent logging across all modules with support for:
     - Multiple log levels (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     - Console and file output
-    - Rotating log files
+    - Rotating log files, written on a background thread
     - Color-coded console output (optional)
     - Per-module log level control
     """
@@ -48,6 +50,9 @@ class LoggerConfig:
     _console_level = logging.INFO
     _file_level = logging.DEBUG
     _loggers: dict[str, logging.Logger] = {}
+    _log_queue: queue.Queue[logging.LogRecord] | None = None
+    _listener: QueueListener | None = None
+    _handlers: list[logging.Handler] = []
 
     # ANSI color codes for console output
     COLORS = {
@@ -117,10 +122,12 @@ class LoggerConfig:
         root_logger = logging.getLogger()
         root_logger.setLevel(logging.DEBUG)  # Capture everything, handlers will filter
 
-        # Remove existing handlers
+        # Remove existing handlers, writing out any queued file records first
+        cls._stop_listener()
         for handler in root_logger.handlers[:]:
             handler.close()
             root_logger.removeHandler(handler)
+        cls._handlers = []
 
         # Create formatters
         if colored_output and log_to_console:
@@ -138,6 +145,7 @@ class LoggerConfig:
             console_handler.setLevel(cls._console_level)
             console_handler.setFormatter(console_formatter)
             root_logger.addHandler(console_handler)
+            cls._handlers.append(console_handler)
 
         # Add file handler with rotation
         if log_to_file:
@@ -149,7 +157,17 @@ class LoggerConfig:
             )
             file_handler.setLevel(cls._file_level)
             file_handler.setFormatter(file_formatter)
-            root_logger.addHandler(file_handler)
+
+            # The file is written by a listener thread; logging calls only
+            # enqueue the record, so disk I/O never blocks the Qt event loop
+            cls._log_queue = queue.Queue()
+            cls._listener = QueueListener(cls._log_queue, file_handler, respect_handler_level=True)
+            cls._listener.start()
+
+            queue_handler = QueueHandler(cls._log_queue)
+            queue_handler.setLevel(cls._file_level)
+            root_logger.addHandler(queue_handler)
+            cls._handlers += [queue_handler, file_handler]
 
         cls._initialized = True
 
@@ -182,15 +200,17 @@ class LoggerConfig:
         Returns:
             logging.Logger: Configured logger instance
         """
-        if not cls._initialized:
-            # Initialize with default settings if not already done
-            cls.initialize()
+        # Single dict lookup on the hit path; a cached logger implies the
+        # system was initialized when it was first created
+        logger = cls._loggers.get(name)
+        if logger is None:
+            if not cls._initialized:
+                # Initialize with default settings if not already done
+                cls.initialize()
 
-        if name not in cls._loggers:
-            logger = logging.getLogger(f"pyzui.{name}")
-            cls._loggers[name] = logger
+            logger = cls._loggers[name] = logging.getLogger(f"pyzui.{name}")
 
-        return cls._loggers[name]
+        return logger
 
     @classmethod
     def set_level(cls, level: int, module: str | None = None) -> None:
@@ -213,11 +233,10 @@ class LoggerConfig:
             logger = cls.get_logger(module)
             logger.setLevel(level)
         else:
-            # Update all loggers
+            # Update all loggers through the handlers created by initialize(),
+            # including the file handler owned by the listener thread
             cls._console_level = level
-            root_logger = logging.getLogger()
-            for handler in root_logger.handlers:
-                # Update both console and file handlers
+            for handler in cls._handlers:
                 handler.setLevel(level)
 
     @classmethod
@@ -252,6 +271,44 @@ class LoggerConfig:
         logger = cls.get_logger("LoggerConfig")
         logger.info("Debug mode disabled")
 
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Method :
+            LoggerConfig.flush()
+        Parameters :
+            None
+
+        LoggerConfig.flush() --> None
+
+        Block until every record queued for the log file has been written.
+        """
+        if cls._log_queue is not None:
+            cls._log_queue.join()
+
+    @classmethod
+    def _stop_listener(cls) -> None:
+        """
+        Method :
+            LoggerConfig._stop_listener()
+        Parameters :
+            None
+
+        LoggerConfig._stop_listener() --> None
+
+        Stop the file logging thread after it has written all queued
+        records, and close the file handler. Called on re-initialization
+        and at interpreter exit.
+        """
+        if cls._listener is None:
+            return
+
+        cls._listener.stop()
+        for handler in cls._listener.handlers:
+            handler.close()
+        cls._listener = None
+        cls._log_queue = None
+
     @classmethod
     def get_log_file_path(cls) -> Path | None:
         """
@@ -270,6 +327,11 @@ class LoggerConfig:
         return cls._log_file
 
 
+# Registered after logging's own shutdown hook, so it runs first and the
+# queued records reach the file before logging closes the handlers
+atexit.register(LoggerConfig._stop_listener)
+
+
 class ColoredFormatter(logging.Formatter):
     """
     Constructor :
@@ -282,6 +344,28 @@ class ColoredFormatter(logging.Formatter):
     Custom formatter that adds color to console output.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Constructor :
+            ColoredFormatter(*args, **kwargs)
+        Parameters :
+            *args, **kwargs : passed through to logging.Formatter
+
+        ColoredFormatter(*args, **kwargs) --> None
+
+        Build the per-level (color, reset) table once, keyed by level number
+        so format() does an int lookup rather than a levelname string lookup.
+        """
+        super().__init__(*args, **kwargs)
+
+        reset = LoggerConfig.COLORS["RESET"]
+        level_numbers = logging.getLevelNamesMapping()
+        self._level_colors = {
+            level_numbers[levelname]: (color, reset)
+            for levelname, color in LoggerConfig.COLORS.items()
+            if levelname in level_numbers
+        }
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Method :
@@ -295,14 +379,8 @@ class ColoredFormatter(logging.Formatter):
 
         Add color codes to the record based on log level.
         """
-        # Add color codes to the record
-        levelname = record.levelname
-        if levelname in LoggerConfig.COLORS:
-            record.color = LoggerConfig.COLORS[levelname]
-            record.reset = LoggerConfig.COLORS["RESET"]
-        else:
-            record.color = ""
-            record.reset = ""
+        # Add color codes to the record; levels without a color get none
+        record.color, record.reset = self._level_colors.get(record.levelno, ("", ""))
 
         return super().format(record)
 
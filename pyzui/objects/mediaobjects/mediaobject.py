@@ -167,8 +167,9 @@ class MediaObject(PhysicalObject):
 
         # self._x and self._y correspond to self.pos[0] and self.pos[1], but
         # mediaobject.pos dosen't support += operation
-        self._x += dx * (2**-self._scene.zoomlevel)
-        self._y += dy * (2**-self._scene.zoomlevel)
+        scale = math.exp2(-self._scene.zoomlevel)
+        self._x += dx * scale
+        self._y += dy * scale
 
     def zoom(self, amount: float) -> None:
         """
@@ -214,8 +215,9 @@ class MediaObject(PhysicalObject):
             # Recalculate amount after clamping
             amount = new_zoomlevel - self._z
 
-        self._x = C_sx - (C_sx - self._x) * math.exp2(amount)
-        self._y = C_sy - (C_sy - self._y) * math.exp2(amount)
+        factor = math.exp2(amount)
+        self._x = C_sx - (C_sx - self._x) * factor
+        self._y = C_sy - (C_sy - self._y) * factor
         self._z = new_zoomlevel
 
     def hides(self, other: "MediaObject") -> bool:
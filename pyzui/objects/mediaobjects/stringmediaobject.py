@@ -16,6 +16,7 @@
 
 """Strings to be displayed in the ZUI."""
 
+import functools
 import time
 from typing import Any
 
@@ -28,6 +29,42 @@ from .mediaobject import LoadError, MediaObject
 from .mediaobjectsutils.string.textlayout import TextLayoutData
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_media_id(media_id: str) -> tuple[int, tuple[str, ...], int]:
+    """
+    Function :
+        _parse_media_id(media_id)
+    Parameters :
+        media_id : str
+
+    _parse_media_id(media_id) --> Tuple[int, Tuple[str, ...], int]
+
+    Parse a 'string:rrggbb:foobar' media_id into the ARGB value of its
+    colour, the lines of its text and the index of the longest line.
+
+    Results are memoized per media_id, since scenes commonly create many
+    string objects with the same label and colour.
+
+    Raises LoadError if the colour is invalid.
+    """
+    # Get color code 'rrggbb' from media_id string and check it with QtGui.QColor
+    hexcol: str = media_id[len("string:") : len("string:rrggbb")]
+    color: QtGui.QColor = QtGui.QColor("#" + hexcol)
+    if not color.isValid():
+        raise LoadError("the supplied colour is invalid")
+
+    # Extract the text portion from media_id by slicing from position after 'string:rrggbb:'
+    # and split it into lines, e.g., 'Hello\nWorld' -> ('Hello', 'World')
+    lines: tuple[str, ...] = tuple(media_id[len("string:rrggbb:") :].split("\n"))
+
+    # Pre-calculate which line is longest to avoid sorting on every render
+    # Returns the INDEX of the longest line, not the line itself
+    # Example: if lines = ('Hi', 'Hello', 'Hey'), this returns 1 (index of 'Hello')
+    longest_line_idx: int = max(range(len(lines)), key=lambda i: len(lines[i]))
+
+    return color.rgba(), lines, longest_line_idx
+
+
 class StringMediaObject(MediaObject):  # , Thread
     """
     Constructor :
@@ -76,15 +113,12 @@ class StringMediaObject(MediaObject):  # , Thread
         MediaObject.__init__(self, media_id, scene)
         self._logger = get_logger("StringMediaObject")
 
-        # Get color code 'rrggbb' from media_id string and assign it to hexcol variable
-        hexcol: str = self._media_id[len("string:") : len("string:rrggbb")]
+        # Parse colour and text lines from media_id (memoized per media_id)
+        # Raises LoadError if the colour is invalid
+        rgba, lines, longest_line_idx = _parse_media_id(self._media_id)
 
         # Initialize and assign QtGui.QColor which can then be passed to QtPainter.setPen
-        self.__color: QtGui.QColor = QtGui.QColor("#" + hexcol)
-
-        # Check if color is valid to QtGui.QColor() and if not an error is raised
-        if not self.__color.isValid():
-            raise LoadError("the supplied colour is invalid")
+        self.__color: QtGui.QColor = QtGui.QColor.fromRgba(rgba)
 
         """Gets to be displayed text `foobar` from media_id string and assign it
         to self.__str variable.
@@ -93,16 +127,12 @@ class StringMediaObject(MediaObject):  # , Thread
         # Example: 'string:FF0000:Hello World' -> 'Hello World'
         self.__str: str = self._media_id[len("string:rrggbb:") :]
 
-        # Returns a list of strings, e.g., 'Hello\nWorld' -> ['Hello', 'World']
-        self.__lines: list[str] = self.__str.split("\n")
+        # Per-instance list of lines, e.g., 'Hello\nWorld' -> ['Hello', 'World']
+        # (a fresh list, so callers never modify the memoized tuple)
+        self.__lines: list[str] = list(lines)
 
-        # Pre-calculate which line is longest to avoid sorting on every render
-        # max() finds the maximum value from range(len(self.__lines)) using a custom key function
-        # range(len(self.__lines)) generates indices: 0, 1, 2, ... for each line
-        # key=lambda i: len(self.__lines[i]) tells max() to compare lines by their length
-        # Returns the INDEX of the longest line, not the line itself
-        # Example: if lines = ['Hi', 'Hello', 'Hey'], this returns 1 (index of 'Hello')
-        self.__longest_line_idx: int = max(range(len(self.__lines)), key=lambda i: len(self.__lines[i]))
+        # Index of the longest line, pre-calculated to avoid sorting on every render
+        self.__longest_line_idx: int = longest_line_idx
 
         # Initialize private variables that will be used for caching optimizations
         # These start as None and will store computed values when first accessed
@@ -45,6 +45,8 @@ class PhysicalObject:  # removed object from class argument and Thread
 
     """
 
+    __slots__ = ("_centre", "_x", "_y", "_z", "vx", "vy", "vz")
+
     # Class-level ZoomManager instance for enforcing zoom limits
     _zoom_manager: ZoomManager | None = None
 
@@ -110,6 +112,10 @@ class PhysicalObject:  # removed object from class argument and Thread
     reduced by a factor of damping_factor: v = u * damping_factor**-t"""
     damping_factor: int = 1024  # 512 #256
 
+    """natural log of damping_factor, used by aim() and the displacement
+    integral on every frame an object moves"""
+    _LOG_DAMPING: float = math.log(damping_factor)
+
     def __damp(self, velocity: float, t: float) -> float:
         """
         Method :
@@ -171,7 +177,7 @@ class PhysicalObject:  # removed object from class argument and Thread
         ## s(t) = -u * d**-t / log(d) + u / log(d)
         ##      = (u / log(d)) * (1 - d**-t)
 
-        return float((u / math.log(self.damping_factor)) * (1 - self.damping_factor**-t))
+        return float((u / self._LOG_DAMPING) * (1 - self.damping_factor**-t))
 
     def move(self, dx: float, dy: float) -> None:
         """
@@ -227,8 +233,9 @@ class PhysicalObject:  # removed object from class argument and Thread
             # Recalculate amount after clamping
             amount = new_zoomlevel - self._z
 
-        self._x = Px - (Px - self._x) * math.exp2(amount)
-        self._y = Py - (Py - self._y) * math.exp2(amount)
+        factor = math.exp2(amount)
+        self._x = Px - (Px - self._x) * factor
+        self._y = Py - (Py - self._y) * factor
         self._z = new_zoomlevel
 
     def aim(self, v: str, s: float, t: float | None = None) -> None:
@@ -254,13 +261,13 @@ class PhysicalObject:  # removed object from class argument and Thread
         if t:
             ## s(t) = (u / log(d)) * (1 - d**-t)
             ## => u = (s(t) * log(d)) / (1 - d**-t)
-            u = (s * math.log(self.damping_factor)) / (1 - self.damping_factor**-t)
+            u = (s * self._LOG_DAMPING) / (1 - self.damping_factor**-t)
         else:
             ## s = lim_t->inf displacement
             ##   = lim_t->inf (u / log(d)) * (1 - d**-t)
             ##   = u / log(d)  since d > 1
             ## therefore u = s * log(d)
-            u = s * math.log(self.damping_factor)
+            u = s * self._LOG_DAMPING
 
         if v == "x":
             self.vx += u
@@ -330,7 +337,7 @@ class PhysicalObject:  # removed object from class argument and Thread
         Returns True if any of vx, vy, or vz are non-zero.
         Returns False if all velocity components are zero.
         """
-        return not (self.vx == self.vy == self.vz == 0)
+        return bool(self.vx or self.vy or self.vz)
 
     def __get_zoomlevel(self) -> float:
         """
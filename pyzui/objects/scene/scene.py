@@ -820,8 +820,9 @@ class Scene(PhysicalObject):
             # Recalculate amount after clamping
             amount = new_zoomlevel - self._z
 
-        self._x = Px - (Px - self._x) * math.exp2(amount)
-        self._y = Py - (Py - self._y) * math.exp2(amount)
+        factor = math.exp2(amount)
+        self._x = Px - (Px - self._x) * factor
+        self._y = Py - (Py - self._y) * factor
         self._z = new_zoomlevel
 
     @property
@@ -101,19 +101,19 @@ class Tile:
             self.__image.scaled(int(width), int(height), QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.FastTransformation)
         )
 
-    def save(self, filename: str) -> None:
+    def save(self, filename: str) -> bool:
         """
         Method :
             Tile.save(filename)
         Parameters :
             filename : str
 
-        Tile.save(filename) --> None
+        Tile.save(filename) --> bool
 
         Save the tile to the location given by `filename` calling ImageQt.save()
-        method.
+        method. Returns False if the tile could not be written.
         """
-        self.__image.save(filename)
+        return self.__image.save(filename)
 
     def draw(self, painter: "QPainter", x: int, y: int) -> None:
         """
@@ -57,6 +57,11 @@ __cleanup_enabled: bool = False
 __cleanup_max_age_days: int = 3
 __cleanup_executed: bool = False
 
+# Media IDs already confirmed as tiled. Once the tiler has written the
+# metadata and (0,0,0) tile they stay on disk until the next tilestore
+# cleanup, so only positive answers from tiled() are memoized.
+__tiled_media: set[str] = set()
+
 
 def init(
     total_cache_size: int = 1024,
@@ -100,6 +105,8 @@ def init(
     __cleanup_max_age_days = cleanup_max_age_days
     __cleanup_executed = False
 
+    clear_tiled_cache()
+
     # tile cache reserved for static tile provider.
     __tilecache = TileCache(int(0.8 * total_cache_size))
 
@@ -202,6 +209,8 @@ def _shutdown_cleanup() -> None:
                 enable=True,
                 collect_stats=False,  # Skip detailed stats for faster cleanup
             )
+            # Cleanup may have removed tiled media from disk
+            clear_tiled_cache()
         except Exception as e:
             if __logger:
                 __logger.error(f"Error during shutdown cleanup: {e}")
@@ -388,9 +397,31 @@ def tiled(media_id: str) -> bool:
 
     Returns True iff the media identified by `media_id` has been tiled.
 
-    Will always return True for dynamic media.
+    Will always return True for dynamic media. Positive answers are
+    memoized until :func:`clear_tiled_cache` is called, since every
+    TiledMediaObject render queries this.
+    """
+    if media_id in __tiled_media:
+        return True
+    if media_id.startswith("dynamic:") or TileStore.tiled(media_id):
+        __tiled_media.add(media_id)
+        return True
+    return False
+
+
+def clear_tiled_cache() -> None:
+    """
+    Function :
+        clear_tiled_cache()
+    Parameters :
+        None
+
+    clear_tiled_cache() --> None
+
+    Forget which media :func:`tiled` has already confirmed, so the next
+    call for each media checks the TileStore again.
     """
-    return media_id.startswith("dynamic:") or TileStore.tiled(media_id)
+    __tiled_media.clear()
 
 
 def get_metadata(media_id: str, key: str) -> Any | None:
@@ -146,6 +146,7 @@ class DynamicTileProvider(TileProvider):
         Implementation Notes:
             - Gets tile path from TileStore with create=True flag
             - Only calls _load_dynamic() if tile file doesn't exist
+            - Retries _load_dynamic() once if the tile directory was removed
             - Uses QImage to load the tile after creation
             - Returns None if tile loading fails (logs exception)
             - Assumes tile is unavailable if any exception occurs
@@ -154,7 +155,13 @@ class DynamicTileProvider(TileProvider):
 
         if not os.path.exists(filename):
             ## tile has not been retrieved yet
-            self._load_dynamic(tile_id, filename)
+            try:
+                self._load_dynamic(tile_id, filename)
+            except FileNotFoundError:
+                ## the tile directory was removed since get_tile_path()
+                ## created it, so create it again and retry once
+                TileStore.recreate_tile_dir(filename)
+                self._load_dynamic(tile_id, filename)
 
         try:
             return QtGui.QImage(filename)
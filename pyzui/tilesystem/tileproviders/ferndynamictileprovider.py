@@ -16,9 +16,10 @@
 
 """Dynamic tile provider for Barnsley's fern."""
 
+import itertools
 import math
 import random
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 from PIL import Image
 
@@ -29,9 +30,6 @@ from .dynamictileprovider import DynamicTileProvider
 ## and math.log(x, 2) with math.log2(x) (2x faster) throughout the codebase.
 ## These changes are performance-critical for zoom operations.
 
-if TYPE_CHECKING:
-    from PIL.Image import Image as PILImage
-
 TileID = tuple[str, int, int, int]  # type: ignore[misc]
 
 
@@ -108,105 +106,30 @@ class FernTileProvider(DynamicTileProvider):
     ]
     color = (100, 170, 0)
 
-    def __choose_transformation(self) -> tuple[float, float, float, float, float, float]:
+    def __choose_transformations(self, n: int) -> list[tuple[float, float, float, float, float, float]]:
         """
         Method :
-            FernTileProvider.__choose_transformation()
+            FernTileProvider.__choose_transformations(n)
         Parameters :
-            None
+            n : int
 
-        FernTileProvider.__choose_transformation() --> Tuple[float, float, float, float, float, float]
+        FernTileProvider.__choose_transformations(n) --> List[Tuple[float, float, float, float, float, float]]
 
-        Randomly choose a transformation based on the probability of each
+        Randomly choose n transformations based on the probability of each
         transformation being chosen.
 
-        This method implements probabilistic selection from the four fern
-        transformations. A random value between 0 and 1 is generated, and
-        transformations are tested in order until one is selected based on
-        cumulative probability.
+        All n choices are drawn in a single random.choices() call over the
+        cumulative probabilities, rather than one random number and a linear
+        probability scan per point of the fern.
 
         Implementation Notes:
-            - Generates random float in range [0, 1)
-            - Iterates through transformations in order
-            - Subtracts each probability from random value
-            - Returns transformation when random value <= probability
-            - Returns 6-tuple: (a, b, c, d, e, f) for affine transform
-        """
-        n = random.uniform(0, 1)
-        chosen_transformation = self.transformations[0][1]  # default to first
-        for probability, transformation in self.transformations:
-            if n <= probability:
-                chosen_transformation = transformation
-                break
-            else:
-                n -= probability
-        return chosen_transformation
-
-    def __transform(self, x: float, y: float) -> tuple[float, float]:
+            - Builds cumulative probabilities from self.transformations
+            - Uses random.choices(..., cum_weights=..., k=n) to pick all n at once
+            - Returns a list of 6-tuples: (a, b, c, d, e, f) for affine transforms
         """
-        Method :
-            FernTileProvider.__transform(x, y)
-        Parameters :
-            x : float
-            y : float
-
-        FernTileProvider.__transform(x, y) --> Tuple[float, float]
-
-        Randomly choose a transformation and apply it to x and y, returning
-        the result as a tuple.
-
-        This method applies one iteration of the fern's iterated function system.
-        It selects a transformation using __choose_transformation() and applies
-        the affine transformation to the input coordinates.
-
-        Implementation Notes:
-            - Calls __choose_transformation() to get transformation coefficients
-            - Applies affine transformation: x' = a*x + b*y + c
-            - Applies affine transformation: y' = d*x + e*y + f
-            - Returns new coordinates as tuple (x', y')
-        """
-        t = self.__choose_transformation()
-        x_new = t[0] * x + t[1] * y + t[2]
-        y_new = t[3] * x + t[4] * y + t[5]
-        return (x_new, y_new)
-
-    def __draw_point(self, tile: "PILImage", x: float, y: float, tilesize_units: float) -> None:
-        """
-        Method :
-            FernTileProvider.__draw_point(tile, x, y, tilesize_units)
-        Parameters :
-            tile : Image
-            x : float
-            y : float
-            tilesize_units : float
-
-        FernTileProvider.__draw_point(tile, x, y, tilesize_units) --> None
-
-        Draw the given point on the given tile.
-
-        Converts fern coordinate space to pixel coordinates and draws a single
-        pixel on the tile. The y-coordinate is inverted to match image coordinate
-        system (origin at top-left).
-
-        Preconditions:
-            - 0.0 <= x <= tilesize_units
-            - 0.0 <= y <= tilesize_units
-
-        Implementation Notes:
-            - Scales x from [0, tilesize_units] to [0, tilesize]
-            - Clamps x to valid pixel range [0, tilesize-1]
-            - Scales y from [0, tilesize_units] to [0, tilesize]
-            - Inverts y-coordinate: pixel_y = tilesize - scaled_y
-            - Clamps y to valid pixel range [0, tilesize-1]
-            - Sets pixel color using self.color (green)
-        """
-
-        x = x * self.tilesize / tilesize_units
-        x = min(int(x), self.tilesize - 1)
-        y = y * self.tilesize / tilesize_units
-        y = min(int(self.tilesize - y), self.tilesize - 1)
-
-        tile.putpixel((x, y), self.color)
+        probabilities = [probability for probability, _transformation in self.transformations]
+        coefficients = [transformation for _probability, transformation in self.transformations]
+        return random.choices(coefficients, cum_weights=list(itertools.accumulate(probabilities)), k=n)
 
     def _load_dynamic(self, tile_id: TileID, outfile: str) -> None:
         """
@@ -231,13 +154,20 @@ class FernTileProvider(DynamicTileProvider):
             - Calculates tile boundaries in fern coordinate space (-5 to 5 for x, 0 to 10 for y)
             - Creates a black RGB image of size tilesize x tilesize
             - Iterates up to max_iterations times, starting from origin (0, 0)
-            - Only draws points that fall within the tile boundaries
+            - Only draws points that fall within the tile boundaries, scaling
+              them to pixels (y inverted, both clamped to tilesize-1)
             - Stops after max_points are drawn to the tile
+            - Points are written into a raw RGB buffer that is copied into the
+              image in one frombytes() call, rather than a putpixel() per point
             - Saves the resulting tile as PNG to outfile
         """
         _media_id, tilelevel, row, col = tile_id
 
-        if row < 0 or col < 0 or row > 2**tilelevel - 1 or col > 2**tilelevel - 1:
+        ## row and col are valid in [0, 2**tilelevel - 1]; shifting (row | col)
+        ## right by tilelevel is nonzero iff either one is >= 2**tilelevel, and
+        ## is -1 (also truthy) iff either one is negative, so a single test
+        ## covers all four bounds; a negative tilelevel has no valid tiles
+        if tilelevel < 0 or (row | col) >> tilelevel:
             ## row,col out of range
             return
 
@@ -255,20 +185,38 @@ class FernTileProvider(DynamicTileProvider):
         x2 = x1 + tilesize_units
         y1 = y2 - tilesize_units
 
-        tile = Image.new("RGB", (self.tilesize, self.tilesize))
+        tilesize = self.tilesize
+        tile = Image.new("RGB", (tilesize, tilesize))
+
+        ## raw RGB pixels of the tile, row-major, 3 bytes per pixel; black
+        ## like the new image, and copied into it once all points are drawn
+        pixels = bytearray(3 * tilesize * tilesize)
+        color = bytes(self.color)
 
         num_points = 0
 
+        ## bind loop invariants to locals; the affine step and the point
+        ## drawing are inlined below instead of being method calls per iteration
+        max_points = self.max_points
+        max_pixel = tilesize - 1
+
         x = 0.0
         y = 0.0
-        for _i in range(self.max_iterations):
+        for a, b, c, d, e, f in self.__choose_transformations(self.max_iterations):
             if x1 <= x <= x2 and y1 <= y <= y2:
-                self.__draw_point(tile, x - x1, y - y1, tilesize_units)
+                ## scale the point to pixels, with y inverted since the image
+                ## origin is its top-left corner, and clamp both to the tile
+                px = min(int((x - x1) * tilesize / tilesize_units), max_pixel)
+                py = min(int(tilesize - (y - y1) * tilesize / tilesize_units), max_pixel)
+                offset = 3 * (py * tilesize + px)
+                pixels[offset : offset + 3] = color
 
                 num_points += 1
-                if num_points > self.max_points:
+                if num_points > max_points:
                     break
 
-            x, y = self.__transform(x, y)
+            ## x_n+1 = a*x_n + b*y_n + c, y_n+1 = d*x_n + e*y_n + f
+            x, y = a * x + b * y + c, d * x + e * y + f
 
+        tile.frombytes(bytes(pixels))
         tile.save(outfile)
@@ -23,6 +23,10 @@ from .tiler import Tiler
 if TYPE_CHECKING:
     pass
 
+## read buffer for the PPM being tiled; scanlines of a few KB each are served
+## from one large read instead of a read() syscall apiece
+_READ_BUFFER_SIZE = 1 << 20
+
 
 def read_ppm_header(f: Any) -> tuple[int, int]:
     """
@@ -114,7 +118,7 @@ class PPMTiler(Tiler):
         Tiler.__init__(self, infile, media_id, filext, tilesize)
 
         try:
-            self.__ppm_fileobj = open(self._infile, "rb")
+            self.__ppm_fileobj = open(self._infile, "rb", buffering=_READ_BUFFER_SIZE)
 
         except OSError:
             raise
@@ -158,7 +158,11 @@ class Tiler(Thread):
         tile_id = (self.__media_id, tilelevel, row, col)
         filename = TileStore.get_tile_path(tile_id, True, self.__outpath, self.__filext)
 
-        tile.save(filename)
+        if not tile.save(filename):
+            ## the tile directory may have been removed since get_tile_path()
+            ## created it, so create it again and retry once
+            TileStore.recreate_tile_dir(filename)
+            tile.save(filename)
 
         self.__progress += 1.0 / self.__numtiles
         self.__logger.info("%3d%% tiled", int(self.__progress * 100))
@@ -308,6 +312,7 @@ class Tiler(Thread):
                 self.error = str(e)
                 outpath = TileStore.get_media_path(self.__media_id)
                 shutil.rmtree(outpath, ignore_errors=True)
+                TileStore.clear_created_dirs(outpath)
                 return None
 
         else:
@@ -323,6 +328,7 @@ class Tiler(Thread):
                 self.error = str(e)
                 outpath = TileStore.get_media_path(self.__media_id)
                 shutil.rmtree(outpath, ignore_errors=True)
+                TileStore.clear_created_dirs(outpath)
                 traceback.print_stack()
                 return None
 
@@ -339,6 +345,7 @@ class Tiler(Thread):
                 self.error = str(e)
                 outpath = TileStore.get_media_path(self.__media_id)
                 shutil.rmtree(outpath, ignore_errors=True)
+                TileStore.clear_created_dirs(outpath)
                 traceback.print_stack()
 
         return tiles
@@ -455,6 +462,7 @@ class Tiler(Thread):
             self.error = str(e)
             outpath = TileStore.get_media_path(self.__media_id)
             shutil.rmtree(outpath, ignore_errors=True)
+            TileStore.clear_created_dirs(outpath)
 
         else:
             TileStore.write_metadata(
@@ -22,6 +22,7 @@ from .tilecache import TileCache
 from .tilestore import (
     auto_cleanup,
     cleanup_old_tiles,
+    clear_created_dirs,
     disk_lock,
     get_directory_size,
     get_media_path,
@@ -29,6 +30,7 @@ from .tilestore import (
     get_tile_path,
     get_tilestore_stats,
     load_metadata,
+    recreate_tile_dir,
     tile_dir,
     tiled,
     write_metadata,
@@ -38,6 +40,7 @@ __all__ = [
     "TileCache",
     "auto_cleanup",
     "cleanup_old_tiles",
+    "clear_created_dirs",
     "disk_lock",
     "get_directory_size",
     "get_media_path",
@@ -45,6 +48,7 @@ __all__ = [
     "get_tile_path",
     "get_tilestore_stats",
     "load_metadata",
+    "recreate_tile_dir",
     "tile_dir",
     "tiled",
     "write_metadata",
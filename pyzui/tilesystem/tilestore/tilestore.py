@@ -21,10 +21,11 @@ import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
+import functools
 import hashlib
 import shutil
 import time
-from threading import RLock
+from threading import Lock, RLock
 from typing import TYPE_CHECKING, Any, Optional
 
 from logger import get_logger  # type: ignore[import-not-found]
@@ -49,6 +50,15 @@ disk_lock = RLock()
 __metadata: dict[str, dict[str, Any]] = {}
 __logger: Optional["Logger"] = None
 
+## tile directories already created by get_tile_path(mkdirp=True) in this
+## process, so tiles sharing a row directory skip the exists/makedirs calls;
+## anything that deletes tile directories must call clear_created_dirs(), and
+## savers call recreate_tile_dir() if a directory was removed behind our back
+__created_dirs: set[str] = set()
+## guards changes to __created_dirs, which provider threads and tiler workers
+## add to while clear_created_dirs() may be iterating over it
+__created_dirs_lock = Lock()
+
 
 def _get_logger() -> Any:
     """
@@ -70,6 +80,24 @@ def _get_logger() -> Any:
     return __logger
 
 
+@functools.lru_cache(maxsize=1024)
+def _media_hash(media_id: str) -> str:
+    """
+    Function :
+        _media_hash(media_id)
+    Parameters :
+        media_id : str
+
+    _media_hash(media_id) --> str
+
+    Return the SHA-1 hex digest naming the tile directory of `media_id`.
+
+    Digests are memoized per media_id, since every tile path lookup for a
+    media hashes the same id.
+    """
+    return hashlib.sha1(media_id.encode("utf-8")).hexdigest()
+
+
 def get_media_path(media_id: str) -> str:
     """
     Function :
@@ -82,9 +110,9 @@ def get_media_path(media_id: str) -> str:
     Return the path to the directory containing the tiles for the media
     identified by `media_id`.
     """
-    # media_hash = hashlib.sha1(media_id).hexdigest() #REPLACED BY:
-    media_hash = hashlib.sha1(media_id.encode("utf-8")).hexdigest()
-    media_dir = os.path.join(tile_dir, media_hash)
+    ## the hash is memoized but tile_dir is read on every call, so changing
+    ## the tilestore directory takes effect immediately
+    media_dir = os.path.join(tile_dir, _media_hash(media_id))
     return media_dir
 
 
@@ -126,15 +154,64 @@ def get_tile_path(tile_id: TileID, mkdirp: bool = False, prefix: str | None = No
 
     filename = os.path.join(prefix, "%02d" % tilelevel, "%06d" % row)
 
-    if mkdirp and not os.path.exists(filename):
+    if mkdirp and filename not in __created_dirs:
         ## create parent directories
-        os.makedirs(filename)
+        os.makedirs(filename, exist_ok=True)
+        with __created_dirs_lock:
+            __created_dirs.add(filename)
 
     filename = os.path.join(filename, "%02d_%06d_%06d.%s" % (tilelevel, row, col, filext))
 
     return filename
 
 
+def clear_created_dirs(prefix: str | None = None) -> None:
+    """
+    Function :
+        clear_created_dirs(prefix)
+    Parameters :
+        prefix : Optional[str]
+
+    clear_created_dirs(prefix) --> None
+
+    Forget the tile directories recorded by :meth:`get_tile_path` as already
+    created, so the next call with `mkdirp` creates them again.
+
+    If `prefix` is given, only directories under `prefix` (e.g. a media path
+    that has just been deleted) are forgotten; otherwise all are.
+    """
+    with __created_dirs_lock:
+        if prefix is None:
+            __created_dirs.clear()
+            return
+
+        prefix = os.path.join(prefix, "")
+        for dirname in [d for d in __created_dirs if d.startswith(prefix)]:
+            __created_dirs.discard(dirname)
+
+
+def recreate_tile_dir(filename: str) -> None:
+    """
+    Function :
+        recreate_tile_dir(filename)
+    Parameters :
+        filename : str
+
+    recreate_tile_dir(filename) --> None
+
+    Create the parent directories of the tile path `filename` again.
+
+    :meth:`get_tile_path` only creates a tile directory the first time it is
+    asked for, so saving into a directory that was later removed without a
+    call to :meth:`clear_created_dirs` fails; savers call this and retry the
+    save once.
+    """
+    dirname = os.path.dirname(filename)
+    os.makedirs(dirname, exist_ok=True)
+    with __created_dirs_lock:
+        __created_dirs.add(dirname)
+
+
 def load_metadata(media_id: str) -> bool:
     """
     Function :
@@ -402,6 +479,7 @@ def cleanup_old_tiles(max_age_days: int = 3, dry_run: bool = False) -> dict[str,
                                 f"(age: {age_days:.1f} days, size: {dir_size_mb:.2f} MB)"
                             )
                             shutil.rmtree(media_path)
+                            clear_created_dirs(media_path)
 
                             # Remove from metadata cache if present
                             for media_id in list(__metadata.keys()):
@@ -0,0 +1,140 @@
+## PyZUI - Python Zooming User Interface
+##
+## This program is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License
+## as published by the Free Software Foundation; either version 3
+## of the License, or (at your option) any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+PPM Reading Benchmark Module
+
+This module measures the two PPM reading routines on the tiling hot path:
+- read_ppm_header, called once per converted image
+- PPMTiler._scanchunk, called once per scanline while tiling
+
+A synthetic black PPM of the requested size is written to a temporary file,
+so no test images are needed and results are comparable between runs.
+
+Usage:
+    python ppmbenchmark.py [--width W] [--height H] [--repeat N]
+
+Example:
+    python test/benchmarks/ppmbenchmark.py
+    python test/benchmarks/ppmbenchmark.py --width 8192 --height 8192 --repeat 3
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from pyzui.tilesystem.tiler.ppm import PPMTiler, read_ppm_header
+
+
+def write_ppm(ppmfile: str, width: int, height: int) -> None:
+    """
+    Function :
+        write_ppm(ppmfile, width, height)
+    Parameters :
+        ppmfile : str
+            - Path of the PPM file to create
+        width : int
+        height : int
+
+    write_ppm(ppmfile, width, height) --> None
+
+    Write a black binary PPM of the given dimensions to ppmfile, one scanline
+    at a time so large images do not need to fit in memory.
+    """
+    row = bytes(3 * width)
+    with open(ppmfile, "wb") as f:
+        f.write(b"P6\n%d %d\n255\n" % (width, height))
+        for _i in range(height):
+            f.write(row)
+
+
+def benchmark(ppmfile: str, width: int, height: int, repeat: int) -> None:
+    """
+    Function :
+        benchmark(ppmfile, width, height, repeat)
+    Parameters :
+        ppmfile : str
+            - Path to the synthetic PPM file
+        width : int
+        height : int
+        repeat : int
+            - Number of timed passes; the fastest one is reported
+
+    benchmark(ppmfile, width, height, repeat) --> None
+
+    Time read_ppm_header on an in-memory header and a full pass of
+    PPMTiler._scanchunk over every scanline of ppmfile, printing the best
+    time of each along with the scanline throughput.
+    """
+    header = b"P6\n%d %d\n255\n" % (width, height)
+    number = 10000
+    best = min(timeit.repeat(lambda: read_ppm_header(io.BytesIO(header)), number=number, repeat=repeat))
+    print("read_ppm_header: %.2fus per call" % (best / number * 1e6))
+
+    best = float("inf")
+    for _i in range(repeat):
+        tiler = PPMTiler(ppmfile)
+        start_time = time.perf_counter()
+        for _row in range(height):
+            tiler._scanchunk()
+        best = min(best, time.perf_counter() - start_time)
+        del tiler
+
+    size_mb = 3 * width * height * 1e-6
+    print(
+        "_scanchunk: %d scanlines took %.3fs, %.2fus per scanline, %.1f MB/s"
+        % (height, best, best / height * 1e6, size_mb / best)
+    )
+
+
+def main() -> None:
+    """
+    Function :
+        main()
+    Parameters :
+        None
+
+    main() --> None
+
+    Entry point for the PPM reading benchmark.
+
+    Parses the command-line options, writes the synthetic PPM to a temporary
+    file, runs the benchmark and removes the file afterwards.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark PPM header parsing and scanline reads")
+    parser.add_argument("--width", type=int, default=4096, help="image width in pixels (default: 4096)")
+    parser.add_argument("--height", type=int, default=4096, help="image height in pixels (default: 4096)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes, best is reported (default: 5)")
+    args = parser.parse_args()
+
+    fd, ppmfile = tempfile.mkstemp(".ppm")
+    os.close(fd)
+
+    try:
+        print("Dimensions: %dx%d, %.2f megapixels" % (args.width, args.height, args.width * args.height * 1e-6))
+        write_ppm(ppmfile, args.width, args.height)
+        benchmark(ppmfile, args.width, args.height, args.repeat)
+    finally:
+        os.unlink(ppmfile)
+
+
+if __name__ == "__main__":
+    main()
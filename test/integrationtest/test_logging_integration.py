@@ -97,6 +97,9 @@ class TestLoggingCommandLine:
             assert "WARNING message" in console_output
             assert "ERROR message" in console_output
 
+            # Wait for the queued records to reach the log file
+            LoggerConfig.flush()
+
             # Check that log file was created
             log_file = Path(temp_dir) / "test_logs" / "pyzui.log"
             assert log_file.exists()
@@ -190,6 +193,9 @@ class TestLoggingCommandLine:
             assert "INFO message" in console_output
             assert "WARNING message" in console_output
 
+            # Wait for the queued records to reach the log file
+            LoggerConfig.flush()
+
             # DEBUG should be in file
             log_file = Path(temp_dir) / "test_logs" / "pyzui.log"
             log_content = log_file.read_text()
@@ -239,6 +245,9 @@ class TestLoggingCommandLine:
             assert "ERROR message" not in console_output
             assert "Test completed - console output should only show this" in console_output
 
+            # Wait for the queued records to reach the log file
+            LoggerConfig.flush()
+
             # But messages should be in file
             log_file = Path(temp_dir) / "test_logs" / "pyzui.log"
             log_content = log_file.read_text()
@@ -326,6 +335,9 @@ class TestLoggingCommandLine:
 
                 print("Test completed")
 
+            # Wait for the queued records to reach the log file
+            LoggerConfig.flush()
+
             # Log file should be in custom directory
             log_file = custom_log_dir / "pyzui.log"
             assert log_file.exists()
@@ -383,6 +395,9 @@ class TestLogFileRotation:
             for i in range(10):
                 logger.debug(f"Test rotation message {i}")
 
+            # Wait for the queued records to reach the log file
+            LoggerConfig.flush()
+
             # Verify file was written to
             assert log_file.stat().st_size > 0
 
@@ -421,12 +436,11 @@ class TestLogFileRotation:
                     verbose=False,
                 )
 
-                # Check handler configuration
-                import logging
+                # Check handler configuration; the file handler is run by the
+                # logging listener thread rather than attached to the root logger
                 from logging.handlers import RotatingFileHandler
 
-                root_logger = logging.getLogger()
-                for handler in root_logger.handlers:
+                for handler in LoggerConfig._listener.handlers:
                     if isinstance(handler, RotatingFileHandler):
                         print(f"Max bytes: {handler.maxBytes}")
                         print(f"Backup count: {handler.backupCount}")
@@ -688,6 +702,9 @@ class TestIntegrationWithComponents:
             # TileManager should log initialization
             assert "TileManager logging test completed" in console_output
 
+            # Wait for the queued records to reach the log file
+            LoggerConfig.flush()
+
             # Check log file for TileManager messages
             log_file = Path(temp_dir) / "test_logs" / "pyzui.log"
             if log_file.exists():
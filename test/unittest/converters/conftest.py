@@ -0,0 +1,30 @@
+## PyZUI - Python Zooming User Interface
+##
+## This program is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License
+## as published by the Free Software Foundation; either version 3
+## of the License, or (at your option) any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared fixtures for the converter unit tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="class")
+def converter(request):
+    """Single converter shared by the tests in a class that only read from it.
+
+    Built from the class's ``converter_class`` and ``converter_infile``, with
+    "output.ppm" as the output file; the conversion thread is never started.
+    """
+    return request.cls.converter_class(request.cls.converter_infile, "output.ppm")
@@ -13,9 +13,57 @@
 ## You should have received a copy of the GNU General Public License
 ## along with this program; if not, see <https://www.gnu.org/licenses/>.
 
+from subprocess import Popen
 from unittest.mock import Mock, mock_open, patch
 
-from pyzui.converters.pdfconverter import PDFConverter
+import pytest
+
+from pyzui.converters.pdfconverter import PDFConverter, _count_pages
+
+
+def _pdftoppm(output=b"", returncode=0):
+    """Return a Popen side effect that prints output and exits with returncode.
+
+    The output is written to the file run() passes as stdout, and the
+    returned process mock is specced from subprocess.Popen.
+    """
+
+    def launch(*args, **kwargs):
+        kwargs["stdout"].write(output)
+        process = Mock(spec=Popen)
+        process.wait.return_value = returncode
+        return process
+
+    return launch
+
+
+@pytest.fixture
+def mock_popen():
+    """Patch subprocess.Popen with a pdftoppm process that exits cleanly.
+
+    The stub and its process are specced from subprocess.Popen, so run()
+    using an attribute the real class lacks fails the test.
+    Tests that need pdftoppm to fail or print output replace
+    ``side_effect`` with another ``_pdftoppm(...)``.
+    pdfinfo is stubbed to report an unknown page count, so run() starts a
+    single pdftoppm process.
+    """
+    with (
+        patch("subprocess.Popen", spec=Popen) as popen,
+        patch("pyzui.converters.pdfconverter._count_pages", return_value=0),
+    ):
+        popen.side_effect = _pdftoppm()
+        yield popen
+
+
+@pytest.fixture
+def mock_tmpdir():
+    """Patch tempfile.mkdtemp to return "/tmp/test" and stub out shutil.rmtree.
+
+    Yields the rmtree mock so tests can check the directory is cleaned up.
+    """
+    with patch("tempfile.mkdtemp", return_value="/tmp/test"), patch("shutil.rmtree") as rmtree:
+        yield rmtree
 
 
 class TestPDFConverter:
@@ -26,7 +74,10 @@ class TestPDFConverter:
     to PPM format using the pdftoppm command-line tool.
     """
 
-    def test_init(self):
+    converter_class = PDFConverter
+    converter_infile = "input.pdf"
+
+    def test_init(self, converter):
         """
         Scenario: Initialize PDF converter
 
@@ -35,12 +86,11 @@ class TestPDFConverter:
         Then it should store the file paths
         And resolution should default to 300
         """
-        converter = PDFConverter("input.pdf", "output.ppm")
         assert converter._infile == "input.pdf"
         assert converter._outfile == "output.ppm"
         assert converter.resolution == 300
 
-    def test_inherits_from_converter(self):
+    def test_inherits_from_converter(self, converter):
         """
         Scenario: Verify inheritance from Converter
 
@@ -50,10 +100,9 @@ class TestPDFConverter:
         """
         from pyzui.converters.converter import Converter
 
-        converter = PDFConverter("input.pdf", "output.ppm")
         assert isinstance(converter, Converter)
 
-    def test_resolution_attribute(self):
+    def test_resolution_attribute(self, converter):
         """
         Scenario: Verify default resolution setting
 
@@ -61,7 +110,6 @@ class TestPDFConverter:
         When checking the resolution attribute
         Then it should be 300 DPI
         """
-        converter = PDFConverter("input.pdf", "output.ppm")
         assert converter.resolution == 300
 
     def test_resolution_can_be_changed(self):
@@ -76,10 +124,7 @@ class TestPDFConverter:
         converter.resolution = 150
         assert converter.resolution == 150
 
-    @patch("subprocess.Popen")
-    @patch("tempfile.mkdtemp")
-    @patch("shutil.rmtree")
-    def test_run_success(self, mock_rmtree, mock_mkdtemp, mock_popen):
+    def test_run_success(self, mock_tmpdir, mock_popen):
         """
         Scenario: Successfully convert PDF to PPM
 
@@ -88,12 +133,6 @@ class TestPDFConverter:
         Then progress should be set to 1.0
         And no error should be set
         """
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_process = Mock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (b"", b"")
-        mock_popen.return_value = mock_process
-
         converter = PDFConverter("input.pdf", "output.ppm")
 
         # Mock the merge method to avoid file operations
@@ -101,10 +140,7 @@ class TestPDFConverter:
             converter.run()
             assert converter._progress == 1.0
 
-    @patch("subprocess.Popen")
-    @patch("tempfile.mkdtemp")
-    @patch("shutil.rmtree")
-    def test_run_pdftoppm_failure(self, mock_rmtree, mock_mkdtemp, mock_popen):
+    def test_run_pdftoppm_failure(self, mock_tmpdir, mock_popen):
         """
         Scenario: Handle pdftoppm conversion failure
 
@@ -113,11 +149,7 @@ class TestPDFConverter:
         Then error should be set with failure message
         And progress should be set to 1.0
         """
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_process = Mock()
-        mock_process.returncode = 1
-        mock_process.communicate.return_value = (b"Error", b"")
-        mock_popen.return_value = mock_process
+        mock_popen.side_effect = _pdftoppm(b"Error", 1)
 
         converter = PDFConverter("input.pdf", "output.ppm")
         converter.run()
@@ -126,10 +158,24 @@ class TestPDFConverter:
         assert "conversion failed" in converter.error
         assert converter._progress == 1.0
 
-    @patch("subprocess.Popen")
-    @patch("tempfile.mkdtemp")
-    @patch("shutil.rmtree")
-    def test_run_cleans_tmpdir(self, mock_rmtree, mock_mkdtemp, mock_popen):
+    def test_run_failure_keeps_last_output_lines(self, mock_tmpdir, mock_popen):
+        """
+        Scenario: Bound the pdftoppm output kept for the error message
+
+        Given pdftoppm prints many warning lines and then fails
+        When run is called
+        Then the error should contain the last output lines
+        And the earliest output lines should have been discarded
+        """
+        mock_popen.side_effect = _pdftoppm(b"".join(b"Syntax Error %d\n" % i for i in range(1000)), 1)
+
+        converter = PDFConverter("input.pdf", "output.ppm")
+        converter.run()
+
+        assert "Syntax Error 999" in converter.error
+        assert "Syntax Error 0\\n" not in converter.error
+
+    def test_run_cleans_tmpdir(self, mock_tmpdir, mock_popen):
         """
         Scenario: Clean up temporary directory after conversion
 
@@ -137,19 +183,13 @@ class TestPDFConverter:
         When run is called
         Then the temporary directory should be removed after conversion
         """
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_process = Mock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (b"", b"")
-        mock_popen.return_value = mock_process
-
         converter = PDFConverter("input.pdf", "output.ppm")
 
         with patch.object(converter, "_PDFConverter__merge"):
             converter.run()
-            mock_rmtree.assert_called_once_with("/tmp/test", ignore_errors=True)
+            mock_tmpdir.assert_called_once_with("/tmp/test", ignore_errors=True)
 
-    def test_str_representation(self):
+    def test_str_representation(self, converter):
         """
         Scenario: Get string representation
 
@@ -157,10 +197,9 @@ class TestPDFConverter:
         When str() is called
         Then it should return the expected format
         """
-        converter = PDFConverter("input.pdf", "output.ppm")
         assert str(converter) == "PDFConverter(input.pdf, output.ppm)"
 
-    def test_repr_representation(self):
+    def test_repr_representation(self, converter):
         """
         Scenario: Get repr representation
 
@@ -168,11 +207,9 @@ class TestPDFConverter:
         When repr() is called
         Then it should return the expected format
         """
-        converter = PDFConverter("input.pdf", "output.ppm")
         assert repr(converter) == "PDFConverter('input.pdf', 'output.ppm')"
 
-    @patch("subprocess.Popen")
-    def test_run_calls_pdftoppm_with_resolution(self, mock_popen):
+    def test_run_calls_pdftoppm_with_resolution(self, mock_tmpdir, mock_popen):
         """
         Scenario: Verify pdftoppm is called with correct resolution
 
@@ -180,22 +217,98 @@ class TestPDFConverter:
         When run is called
         Then pdftoppm should be invoked with the -r flag and resolution value
         """
-        mock_process = Mock()
-        mock_process.returncode = 1
-        mock_process.communicate.return_value = (b"", b"")
-        mock_popen.return_value = mock_process
+        mock_popen.side_effect = _pdftoppm(returncode=1)
 
         converter = PDFConverter("input.pdf", "output.ppm")
         converter.resolution = 200
 
-        with patch("tempfile.mkdtemp", return_value="/tmp/test"), patch("shutil.rmtree"):
-            converter.run()
+        converter.run()
 
         # Check that pdftoppm was called with resolution
         call_args = mock_popen.call_args[0][0]
         assert "-r" in call_args
         assert "200" in call_args
 
+    def test_run_shards_pages(self, mock_tmpdir, mock_popen):
+        """
+        Scenario: Rasterize a multi-page PDF with concurrent pdftoppm processes
+
+        Given a 10-page PDF and a limit of 4 pdftoppm processes
+        When run is called
+        Then 4 pdftoppm processes should be started on contiguous page ranges
+        And the ranges should cover every page exactly once
+        """
+        converter = PDFConverter("input.pdf", "output.ppm")
+        with (
+            patch("pyzui.converters.pdfconverter._count_pages", return_value=10),
+            patch("pyzui.converters.pdfconverter._MAX_SHARDS", 4),
+            patch.object(converter, "_PDFConverter__merge"),
+        ):
+            converter.run()
+
+        ranges = []
+        for call in mock_popen.call_args_list:
+            argv = call[0][0]
+            ranges.append((argv[argv.index("-f") + 1], argv[argv.index("-l") + 1]))
+        assert ranges == [("1", "2"), ("3", "5"), ("6", "7"), ("8", "10")]
+        assert converter.error is None
+
+    def test_run_shard_failure_sets_error(self, mock_tmpdir, mock_popen):
+        """
+        Scenario: Report a failed page range
+
+        Given a 4-page PDF split across 2 pdftoppm processes
+        When the second process fails
+        Then error should be set with that process's return code
+        """
+        launches = iter([_pdftoppm(), _pdftoppm(b"Error", 3)])
+        mock_popen.side_effect = lambda *args, **kwargs: next(launches)(*args, **kwargs)
+
+        converter = PDFConverter("input.pdf", "output.ppm")
+        with (
+            patch("pyzui.converters.pdfconverter._count_pages", return_value=4),
+            patch("pyzui.converters.pdfconverter._MAX_SHARDS", 2),
+        ):
+            converter.run()
+
+        assert mock_popen.call_count == 2
+        assert "return code 3" in converter.error
+
+    def test_run_launch_failure_cleans_up(self, mock_tmpdir, mock_popen):
+        """
+        Scenario: A pdftoppm process cannot be started
+
+        Given a 4-page PDF split across 2 pdftoppm processes
+        When starting the second process raises OSError
+        Then the first process should be killed and reaped
+        And the temporary directory should be removed
+        And error should be set
+        """
+        first = Mock(spec=Popen)
+        first.poll.return_value = None
+        launches = iter([first, OSError("Resource temporarily unavailable")])
+
+        def launch(*args, **kwargs):
+            result = next(launches)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        mock_popen.side_effect = launch
+
+        converter = PDFConverter("input.pdf", "output.ppm")
+        with (
+            patch("pyzui.converters.pdfconverter._count_pages", return_value=4),
+            patch("pyzui.converters.pdfconverter._MAX_SHARDS", 2),
+        ):
+            converter.run()
+
+        first.kill.assert_called_once_with()
+        first.wait.assert_called_once_with()
+        mock_tmpdir.assert_called_once_with("/tmp/test", ignore_errors=True)
+        assert "Resource temporarily unavailable" in converter.error
+        assert converter._progress == 1.0
+
     @patch("os.listdir")
     @patch("builtins.open", new_callable=mock_open)
     @patch("pyzui.converters.pdfconverter.read_ppm_header")
@@ -284,11 +397,8 @@ class TestPDFConverter:
         log_calls = str(mock_logger.error.call_args_list) + str(mock_logger.warning.call_args_list)
         assert "error loading PPM" in log_calls or "Truncating PDF" in log_calls
 
-    @patch("subprocess.Popen")
-    @patch("tempfile.mkdtemp")
-    @patch("shutil.rmtree")
     @patch("os.unlink")
-    def test_run_handles_merge_exception(self, mock_unlink, mock_rmtree, mock_mkdtemp, mock_popen):
+    def test_run_handles_merge_exception(self, mock_unlink, mock_tmpdir, mock_popen):
         """
         Scenario: Handle exception during merge operation
 
@@ -298,12 +408,6 @@ class TestPDFConverter:
         And the output file should be unlinked
         And error attribute should be set
         """
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_process = Mock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (b"", b"")
-        mock_popen.return_value = mock_process
-
         converter = PDFConverter("input.pdf", "output.ppm")
 
         # Make __merge raise an exception
@@ -315,11 +419,8 @@ class TestPDFConverter:
         assert "Merge failed" in converter.error
         mock_unlink.assert_called_once_with("output.ppm")
 
-    @patch("subprocess.Popen")
-    @patch("tempfile.mkdtemp")
-    @patch("shutil.rmtree")
     @patch("os.unlink")
-    def test_run_handles_unlink_exception(self, mock_unlink, mock_rmtree, mock_mkdtemp, mock_popen):
+    def test_run_handles_unlink_exception(self, mock_unlink, mock_tmpdir, mock_popen):
         """
         Scenario: Handle exception when unlinking output file
 
@@ -327,11 +428,6 @@ class TestPDFConverter:
         When run is called
         Then both exceptions should be handled gracefully
         """
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_process = Mock()
-        mock_process.returncode = 0
-        mock_process.communicate.return_value = (b"", b"")
-        mock_popen.return_value = mock_process
 
         # Make unlink also raise an exception
         mock_unlink.side_effect = OSError("Permission denied")
@@ -364,3 +460,42 @@ class TestPDFConverter:
         converter._PDFConverter__merge("/tmp/test")
 
         assert converter._progress == 0.5
+
+
+class TestCountPages:
+    """
+    Feature: PDF page counting
+
+    This test suite validates _count_pages, which asks pdfinfo how many pages
+    a PDF has so PDFConverter can split rasterization across processes.
+    """
+
+    @pytest.mark.parametrize(
+        ("stdout", "expected"),
+        [
+            pytest.param(b"Title:          doc\nPages:          12\nEncrypted:      no\n", 12, id="pages_line"),
+            pytest.param(b"Title:          doc\n", 0, id="no_pages_line"),
+            pytest.param(b"Pages:          ?\n", 0, id="unparsable"),
+        ],
+    )
+    def test_count_pages(self, stdout, expected):
+        """
+        Scenario: Parse the page count from pdfinfo output
+
+        Given pdfinfo output with or without a valid "Pages:" line
+        When _count_pages is called
+        Then it should return the page count, or 0 if there is none
+        """
+        with patch("subprocess.run", return_value=Mock(stdout=stdout)):
+            assert _count_pages("input.pdf") == expected
+
+    def test_count_pages_without_pdfinfo(self):
+        """
+        Scenario: pdfinfo is not installed
+
+        Given pdfinfo cannot be executed
+        When _count_pages is called
+        Then it should return 0
+        """
+        with patch("subprocess.run", side_effect=FileNotFoundError("pdfinfo")):
+            assert _count_pages("input.pdf") == 0
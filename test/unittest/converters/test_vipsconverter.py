@@ -22,6 +22,42 @@ import pytest
 from pyzui.converters.vipsconverter import VipsConverter
 
 
+# Sample images shipped in the repository's data folder, relative to test/unittest
+_DATA_DIR = "../../data"
+
+
+def _find_data_file(*extensions):
+    """Return the first file in the data folder with one of the given extensions, or skip."""
+    if os.path.isdir(_DATA_DIR):
+        for name in sorted(os.listdir(_DATA_DIR)):
+            fullpath = os.path.join(_DATA_DIR, name)
+            if name.lower().endswith(extensions) and os.path.isfile(fullpath):
+                return fullpath
+
+    pytest.skip(f"Test file not found, place a {'/'.join(extensions)} test file in ./data folder")
+
+
+@pytest.fixture(scope="session")
+def climb_png():
+    """Path to the small PNG sample, probed once per session."""
+    infile = os.path.join(_DATA_DIR, "07_climb.png")
+    if not os.path.exists(infile):
+        pytest.skip(f"Test file not found: {infile}")
+    return infile
+
+
+@pytest.fixture(scope="session")
+def tiff_file():
+    """Path to a TIFF sample from the data folder, found once per session."""
+    return _find_data_file(".tif", ".tiff")
+
+
+@pytest.fixture(scope="session")
+def jpeg_file():
+    """Path to a JPEG sample from the data folder, found once per session."""
+    return _find_data_file(".jpg", ".jpeg")
+
+
 class TestVipsConverter:
     """
     Feature: Vips Converter
@@ -30,7 +66,10 @@ class TestVipsConverter:
     to PPM using the pyvips library, handling different color depths and band configurations.
     """
 
-    def test_init(self):
+    converter_class = VipsConverter
+    converter_infile = "input.jpg"
+
+    def test_init(self, converter):
         """
         Scenario: Initialize Vips converter
 
@@ -39,12 +78,11 @@ class TestVipsConverter:
         Then it should store the file paths
         And bitdepth should be set to 8
         """
-        converter = VipsConverter("input.jpg", "output.ppm")
         assert converter._infile == "input.jpg"
         assert converter._outfile == "output.ppm"
         assert converter.bitdepth == 8
 
-    def test_inherits_from_converter(self):
+    def test_inherits_from_converter(self, converter):
         """
         Scenario: Verify inheritance from Converter
 
@@ -54,10 +92,9 @@ class TestVipsConverter:
         """
         from pyzui.converters.converter import Converter
 
-        converter = VipsConverter("input.jpg", "output.ppm")
         assert isinstance(converter, Converter)
 
-    def test_bitdepth_attribute(self):
+    def test_bitdepth_attribute(self, converter):
         """
         Scenario: Verify bitdepth setting
 
@@ -65,7 +102,6 @@ class TestVipsConverter:
         When checking the bitdepth attribute
         Then it should be 8
         """
-        converter = VipsConverter("input.jpg", "output.ppm")
         assert converter.bitdepth == 8
 
     @patch("pyvips.Image.new_from_file")
@@ -209,7 +245,7 @@ class TestVipsConverter:
         assert converter._progress == 1.0
         mock_unlink.assert_called_once_with("output.ppm")
 
-    def test_str_representation(self):
+    def test_str_representation(self, converter):
         """
         Scenario: Get string representation
 
@@ -217,13 +253,12 @@ class TestVipsConverter:
         When str() is called
         Then it should return the expected format
         """
-        converter = VipsConverter("input.jpg", "output.ppm")
         assert (
             str(converter)
             == "VipsConverter(input.jpg, output.ppm, rotation=0, invert_colors=False, black_and_white=False)"
         )
 
-    def test_repr_representation(self):
+    def test_repr_representation(self, converter):
         """
         Scenario: Get repr representation
 
@@ -231,13 +266,12 @@ class TestVipsConverter:
         When repr() is called
         Then it should return the expected format
         """
-        converter = VipsConverter("input.jpg", "output.ppm")
         assert (
             repr(converter)
             == "VipsConverter('input.jpg', 'output.ppm', rotation=0, invert_colors=False, black_and_white=False)"
         )
 
-    def test_small_image_conversion(self):
+    def test_small_image_conversion(self, climb_png):
         """
         Scenario: Integration test for small PNG conversion
 
@@ -247,15 +281,11 @@ class TestVipsConverter:
         And progress should be 1.0
         And output file should exist with valid PPM format
         """
-        infile = "../../data/07_climb.png"
-
-        # Skip test if file doesn't exist
-        if not os.path.exists(infile):
-            pytest.skip(f"Test file not found: {infile}")
+        infile = climb_png
 
-        # Create temporary output file
-        with tempfile.NamedTemporaryFile(suffix=".ppm", delete=False) as tmp:
-            outfile = tmp.name
+        # Reserve a temporary output path; the converter reopens it by name
+        fd, outfile = tempfile.mkstemp(suffix=".ppm")
+        os.close(fd)
 
         try:
             # Create and run converter
@@ -266,20 +296,23 @@ class TestVipsConverter:
             # Verify conversion succeeded
             assert converter.error is None, f"Conversion failed: {converter.error}"
             assert converter._progress == 1.0
-            assert os.path.exists(outfile), "Output file not created"
-            assert os.path.getsize(outfile) > 0, "Output file is empty"
+            # One stat both checks the output exists and that it is not empty
+            assert os.stat(outfile).st_size > 0, "Output file is empty"
 
-            # Verify it's a valid PPM file (P6 binary format)
-            with open(outfile, "rb") as f:
+            # Verify it's a valid PPM file (P6 binary format); unbuffered, as
+            # only the two magic bytes are read
+            with open(outfile, "rb", buffering=0) as f:
                 magic = f.read(2)
                 assert magic == b"P6", f"Invalid PPM format, magic number: {magic}"
 
         finally:
-            # Cleanup
-            if os.path.exists(outfile):
+            # Cleanup; the converter may not have left a file behind
+            try:
                 os.unlink(outfile)
+            except FileNotFoundError:
+                pass
 
-    def test_large_tiff_conversion(self):
+    def test_large_tiff_conversion(self, tiff_file):
         """
         Scenario: Integration test for large TIFF conversion
 
@@ -289,24 +322,11 @@ class TestVipsConverter:
         And progress should be 1.0
         And output file should exist with valid PPM format
         """
+        infile = tiff_file
 
-        for name in os.listdir("../../data"):
-            fullpath = os.path.join("../../data", name)
-
-            if (os.path.isfile(fullpath) and name.lower().endswith(".tiff")) or (
-                os.path.isfile(fullpath) and name.lower().endswith(".tif")
-            ):
-                infile = fullpath
-            else:
-                infile = ""
-
-        # Skip test if file doesn't exist
-        if not os.path.exists(infile):
-            pytest.skip("Test file not found, place .tif/.tiff test file in ./data folder")
-
-        # Create temporary output file
-        with tempfile.NamedTemporaryFile(suffix=".ppm", delete=False) as tmp:
-            outfile = tmp.name
+        # Reserve a temporary output path; the converter reopens it by name
+        fd, outfile = tempfile.mkstemp(suffix=".ppm")
+        os.close(fd)
 
         try:
             # Create and run converter
@@ -317,20 +337,23 @@ class TestVipsConverter:
             # Verify conversion succeeded
             assert converter.error is None, f"Conversion failed: {converter.error}"
             assert converter._progress == 1.0
-            assert os.path.exists(outfile), "Output file not created"
-            assert os.path.getsize(outfile) > 0, "Output file is empty"
+            # One stat both checks the output exists and that it is not empty
+            assert os.stat(outfile).st_size > 0, "Output file is empty"
 
-            # Verify it's a valid PPM file (P6 binary format)
-            with open(outfile, "rb") as f:
+            # Verify it's a valid PPM file (P6 binary format); unbuffered, as
+            # only the two magic bytes are read
+            with open(outfile, "rb", buffering=0) as f:
                 magic = f.read(2)
                 assert magic == b"P6", f"Invalid PPM format, magic number: {magic}"
 
         finally:
-            # Cleanup
-            if os.path.exists(outfile):
+            # Cleanup; the converter may not have left a file behind
+            try:
                 os.unlink(outfile)
+            except FileNotFoundError:
+                pass
 
-    def test_jpeg_conversion(self):
+    def test_jpeg_conversion(self, jpeg_file):
         """
         Scenario: Integration test for JPEG conversion
 
@@ -340,23 +363,11 @@ class TestVipsConverter:
         And progress should be 1.0
         And output file should exist with valid PPM format
         """
-        for name in os.listdir("../../data"):
-            fullpath = os.path.join("../../data", name)
-
-            if (os.path.isfile(fullpath) and name.lower().endswith(".jpg")) or (
-                os.path.isfile(fullpath) and name.lower().endswith(".jpeg")
-            ):
-                infile = fullpath
-            else:
-                infile = ""
-
-        # Skip test if file doesn't exist
-        if not os.path.exists(infile):
-            pytest.skip("Test file not found, place .jpg/.jpeg test file in ./data folder")
+        infile = jpeg_file
 
-        # Create temporary output file
-        with tempfile.NamedTemporaryFile(suffix=".ppm", delete=False) as tmp:
-            outfile = tmp.name
+        # Reserve a temporary output path; the converter reopens it by name
+        fd, outfile = tempfile.mkstemp(suffix=".ppm")
+        os.close(fd)
 
         try:
             # Create and run converter
@@ -367,15 +378,18 @@ class TestVipsConverter:
             # Verify conversion succeeded
             assert converter.error is None, f"Conversion failed: {converter.error}"
             assert converter._progress == 1.0
-            assert os.path.exists(outfile), "Output file not created"
-            assert os.path.getsize(outfile) > 0, "Output file is empty"
+            # One stat both checks the output exists and that it is not empty
+            assert os.stat(outfile).st_size > 0, "Output file is empty"
 
-            # Verify it's a valid PPM file (P6 binary format)
-            with open(outfile, "rb") as f:
+            # Verify it's a valid PPM file (P6 binary format); unbuffered, as
+            # only the two magic bytes are read
+            with open(outfile, "rb", buffering=0) as f:
                 magic = f.read(2)
                 assert magic == b"P6", f"Invalid PPM format, magic number: {magic}"
 
         finally:
-            # Cleanup
-            if os.path.exists(outfile):
+            # Cleanup; the converter may not have left a file behind
+            try:
                 os.unlink(outfile)
+            except FileNotFoundError:
+                pass
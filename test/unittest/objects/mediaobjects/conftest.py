@@ -0,0 +1,70 @@
+## PyZUI - Python Zooming User Interface
+##
+## This program is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License
+## as published by the Free Software Foundation; either version 3
+## of the License, or (at your option) any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared fixtures for the media object unit tests.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+# QSize-shaped stand-in returned by the fake renderer's defaultSize()
+_FAKE_SIZE = SimpleNamespace(width=lambda: 100, height=lambda: 200)
+
+
+@pytest.fixture(scope="module")
+def scene():
+    """Read-only scene mock shared by every test in a module.
+
+    Tests that only pass the scene through to a media object constructor
+    use this fixture so a single Mock is built per module.
+    """
+    return Mock()
+
+
+@pytest.fixture
+def fresh_scene():
+    """Per-test scene mock for tests that set attributes on the scene."""
+    return Mock()
+
+
+@pytest.fixture
+def qsvg(monkeypatch):
+    """Replace QSvgRenderer with a MagicMock that loads a 100x200 SVG.
+
+    The renderer instance is ``qsvg.return_value``; tests that need a
+    parse failure set ``qsvg.return_value.load.return_value = False``.
+    """
+    fake = MagicMock()
+    fake.return_value.load.return_value = True
+    fake.return_value.defaultSize.return_value = _FAKE_SIZE
+    monkeypatch.setattr("pyzui.objects.mediaobjects.svgmediaobject.QtSvg.QSvgRenderer", fake)
+    return fake
+
+
+@pytest.fixture
+def tilemanager(monkeypatch):
+    """Stub the TileManager calls made by TiledMediaObject.__init__.
+
+    Returns a Mock whose ``tiled`` and ``load_tile`` attributes are the
+    replacements; ``tiled`` reports the media as already tiled by default.
+    """
+    stub = Mock()
+    stub.tiled.return_value = True
+    monkeypatch.setattr("pyzui.objects.mediaobjects.tiledmediaobject.TileManager.tiled", stub.tiled)
+    monkeypatch.setattr("pyzui.objects.mediaobjects.tiledmediaobject.TileManager.load_tile", stub.load_tile)
+    return stub
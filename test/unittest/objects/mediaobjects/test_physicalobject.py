@@ -14,21 +14,46 @@
 ## along with this program; if not, see <https://www.gnu.org/licenses/>.
 
 import math
+import random
 
 import pytest
 
 from pyzui.objects.physicalobject import PhysicalObject
 
 
+@pytest.fixture
+def obj():
+    """A fresh PhysicalObject for tests that mutate position or velocity."""
+    return PhysicalObject()
+
+
+@pytest.fixture(scope="module")
+def default_obj():
+    """A shared PhysicalObject for tests that only read its default state."""
+    return PhysicalObject()
+
+
+@pytest.fixture
+def positioned_obj(obj):
+    """A PhysicalObject at (10, 20) with its centre offset at (5, 10)."""
+    obj._x = 10.0
+    obj._y = 20.0
+    obj._centre = (5, 10)
+    return obj
+
+
 class TestPhysicalObject:
     """
     Feature: PhysicalObject Class
 
     This class tests the PhysicalObject functionality including position tracking, velocity management,
     physics simulation, and coordinate transformations used for animation and movement in PyZUI.
+
+    Position checks after move() cast through float() and compare with pytest.approx,
+    so they hold whatever numeric type backs _x and _y.
     """
 
-    def test_init(self):
+    def test_init(self, default_obj):
         """
         Scenario: Initialize PhysicalObject with default values
 
@@ -36,16 +61,15 @@ class TestPhysicalObject:
         When it is instantiated
         Then all position and velocity attributes should be initialized to zero
         """
-        obj = PhysicalObject()
-        assert obj._x == 0.0
-        assert obj._y == 0.0
-        assert obj._z == 0.0
-        assert obj.vx == 0.0
-        assert obj.vy == 0.0
-        assert obj.vz == 0.0
-        assert obj._centre == (0, 0)
+        assert default_obj._x == 0.0
+        assert default_obj._y == 0.0
+        assert default_obj._z == 0.0
+        assert default_obj.vx == 0.0
+        assert default_obj.vy == 0.0
+        assert default_obj.vz == 0.0
+        assert default_obj._centre == (0, 0)
 
-    def test_damping_factor(self):
+    def test_damping_factor(self, default_obj):
         """
         Scenario: Verify damping factor attribute
 
@@ -53,36 +77,28 @@ class TestPhysicalObject:
         When accessing the damping_factor attribute
         Then it should be 1024
         """
-        obj = PhysicalObject()
-        assert obj.damping_factor == 1024
+        assert default_obj.damping_factor == 1024
 
-    def test_move(self):
+    @pytest.mark.parametrize(
+        ("dx", "dy"),
+        [
+            pytest.param(10, 20, id="positive"),
+            pytest.param(-5, -10, id="negative"),
+        ],
+    )
+    def test_move(self, obj, dx, dy):
         """
         Scenario: Move object to new position
 
         Given a PhysicalObject at the origin
-        When calling move with x=10 and y=20
-        Then the object position should be updated to (10, 20)
-        """
-        obj = PhysicalObject()
-        obj.move(10, 20)
-        assert obj._x == 10.0
-        assert obj._y == 20.0
-
-    def test_move_negative(self):
-        """
-        Scenario: Move object to negative coordinates
-
-        Given a PhysicalObject
-        When calling move with negative x and y values
-        Then the object should accept and store negative coordinates
+        When calling move with a positive or negative displacement
+        Then the object position should equal that displacement
         """
-        obj = PhysicalObject()
-        obj.move(-5, -10)
-        assert obj._x == -5.0
-        assert obj._y == -10.0
+        obj.move(dx, dy)
+        assert float(obj._x) == pytest.approx(dx)
+        assert float(obj._y) == pytest.approx(dy)
 
-    def test_zoom(self):
+    def test_zoom(self, obj):
         """
         Scenario: Zoom by delta amount
 
@@ -90,7 +106,6 @@ class TestPhysicalObject:
         When calling zoom with delta value
         Then the z-coordinate should increase by the delta amount
         """
-        obj = PhysicalObject()
         obj._x = 0.0
         obj._y = 0.0
         obj._centre = (0, 0)
@@ -98,7 +113,7 @@ class TestPhysicalObject:
         obj.zoom(1.0)
         assert obj._z == initial_z + 1.0
 
-    def test_zoomlevel_property(self):
+    def test_zoomlevel_property(self, obj):
         """
         Scenario: Set and get zoomlevel property
 
@@ -106,12 +121,11 @@ class TestPhysicalObject:
         When setting zoomlevel to 5.0
         Then both zoomlevel and internal _z should be 5.0
         """
-        obj = PhysicalObject()
         obj.zoomlevel = 5.0
         assert obj.zoomlevel == 5.0
         assert obj._z == 5.0
 
-    def test_centre_property_get(self):
+    def test_centre_property_get(self, positioned_obj):
         """
         Scenario: Get centre coordinates
 
@@ -119,15 +133,10 @@ class TestPhysicalObject:
         When accessing the centre property
         Then it should return the combined coordinates
         """
-        obj = PhysicalObject()
-        obj._x = 10.0
-        obj._y = 20.0
-        obj._z = 0.0
-        obj._centre = (5, 10)
-        centre = obj.centre
+        centre = positioned_obj.centre
         assert centre == (15.0, 30.0)
 
-    def test_centre_property_set(self):
+    def test_centre_property_set(self, obj):
         """
         Scenario: Set centre coordinates
 
@@ -135,14 +144,13 @@ class TestPhysicalObject:
         When setting the centre property to (100, 200)
         Then the internal _centre should be updated to (100.0, 200.0)
         """
-        obj = PhysicalObject()
         obj._x = 0.0
         obj._y = 0.0
         obj._z = 0.0
         obj.centre = (100, 200)
         assert obj._centre == (100.0, 200.0)
 
-    def test_moving_property_false(self):
+    def test_moving_property_false(self, default_obj):
         """
         Scenario: Check moving property when stationary
 
@@ -150,10 +158,9 @@ class TestPhysicalObject:
         When checking the moving property
         Then it should return False
         """
-        obj = PhysicalObject()
-        assert obj.moving is False
+        assert default_obj.moving is False
 
-    def test_moving_property_true(self):
+    def test_moving_property_true(self, obj):
         """
         Scenario: Check moving property when in motion
 
@@ -161,50 +168,42 @@ class TestPhysicalObject:
         When checking the moving property
         Then it should return True
         """
-        obj = PhysicalObject()
         obj.vx = 10.0
         assert obj.moving is True
 
-    def test_aim_x_no_time(self):
-        """
-        Scenario: Aim for target x displacement
-
-        Given a PhysicalObject
-        When calling aim for x-axis with a target displacement
-        Then velocity should be calculated based on damping factor
-        """
-        obj = PhysicalObject()
-        obj.aim("x", 100.0)
-        expected = 100.0 * math.log(obj.damping_factor)
-        assert obj.vx == pytest.approx(expected)
-
-    def test_aim_y_no_time(self):
+    @pytest.mark.parametrize("axis", ["vx", "vy", "vz"])
+    def test_moving_property_single_axis(self, obj, axis):
         """
-        Scenario: Aim for target y displacement
+        Scenario: Check moving property with velocity on one axis only
 
-        Given a PhysicalObject
-        When calling aim for y-axis with a target displacement
-        Then velocity should be calculated based on damping factor
+        Given a PhysicalObject with a negative velocity on a single axis
+        When checking the moving property
+        Then it should return True
         """
-        obj = PhysicalObject()
-        obj.aim("y", 50.0)
-        expected = 50.0 * math.log(obj.damping_factor)
-        assert obj.vy == pytest.approx(expected)
+        setattr(obj, axis, -0.5)
+        assert obj.moving is True
 
-    def test_aim_z_no_time(self):
+    @pytest.mark.parametrize(
+        ("axis", "velocity", "s"),
+        [
+            pytest.param("x", "vx", 100.0, id="x"),
+            pytest.param("y", "vy", 50.0, id="y"),
+            pytest.param("z", "vz", 2.0, id="z"),
+        ],
+    )
+    def test_aim_no_time(self, obj, axis, velocity, s):
         """
-        Scenario: Aim for target z displacement
+        Scenario: Aim for target displacement on one axis
 
         Given a PhysicalObject
-        When calling aim for z-axis with a target displacement
-        Then velocity should be calculated based on damping factor
+        When calling aim for the x, y or z axis with a target displacement
+        Then that axis' velocity should be calculated based on damping factor
         """
-        obj = PhysicalObject()
-        obj.aim("z", 2.0)
-        expected = 2.0 * math.log(obj.damping_factor)
-        assert obj.vz == pytest.approx(expected)
+        obj.aim(axis, s)
+        expected = s * math.log(obj.damping_factor)
+        assert getattr(obj, velocity) == pytest.approx(expected)
 
-    def test_aim_with_time(self):
+    def test_aim_with_time(self, obj):
         """
         Scenario: Aim with specific time constraint
 
@@ -212,29 +211,55 @@ class TestPhysicalObject:
         When calling aim with a time parameter
         Then velocity should be adjusted to reach target in specified time
         """
-        obj = PhysicalObject()
         obj.aim("x", 100.0, t=1.0)
         expected = (100.0 * math.log(obj.damping_factor)) / (1 - obj.damping_factor**-1.0)
         assert obj.vx == pytest.approx(expected)
 
-    def test_step(self):
+    def test_step(self, obj):
         """
         Scenario: Advance physics simulation by time step
 
-        Given a PhysicalObject with non-zero velocity
-        When calling step with a time delta
-        Then the object position should be updated
+        Given a PhysicalObject at the origin with velocity (100, 50)
+        When calling step with a time delta of 0.1
+        Then the position should equal the closed-form damped displacement
+        And the velocity should be damped by damping_factor**-0.1
         """
-        obj = PhysicalObject()
+        d = obj.damping_factor
         obj.vx = 100.0
         obj.vy = 50.0
-        initial_x = obj._x
-        initial_y = obj._y
         obj.step(0.1)
-        # Object should have moved
-        assert obj._x != initial_x or obj._y != initial_y
+        assert (obj._x, obj._y) == pytest.approx(
+            ((100.0 / math.log(d)) * (1 - d**-0.1), (50.0 / math.log(d)) * (1 - d**-0.1)), rel=0, abs=0
+        )
+        assert (obj.vx, obj.vy) == pytest.approx((100.0 * d**-0.1, 50.0 * d**-0.1), rel=0, abs=0)
+
+    def test_step_batch_reference(self):
+        """
+        Scenario: Step matches the closed-form reference for many velocities
+
+        Given 1000 PhysicalObjects with seeded random x velocities in [-100, 100]
+        When each object steps forward 0.1 seconds
+        Then every position and velocity should exactly match the closed-form
+        displacement s = (u / log(d)) * (1 - d**-t) and damping v = u * d**-t
+        """
+        rng = random.Random(0)
+        t = 0.1
+        d = PhysicalObject.damping_factor
+        velocities = [rng.uniform(-100, 100) for _ in range(1000)]
+
+        expected = []
+        actual = []
+        for u in velocities:
+            v = u * d**-t
+            expected.append(((u / math.log(d)) * (1 - d**-t), v if abs(v) >= 0.4 else 0.0))
+            obj = PhysicalObject()
+            obj.vx = u
+            obj.step(t)
+            actual.append((obj._x, obj.vx))
+
+        assert actual == expected
 
-    def test_step_damping(self):
+    def test_step_damping(self, obj):
         """
         Scenario: Apply velocity damping during step
 
@@ -242,14 +267,13 @@ class TestPhysicalObject:
         When calling step
         Then the velocity should be reduced by damping
         """
-        obj = PhysicalObject()
         obj.vx = 100.0
         initial_vx = obj.vx
         obj.step(0.5)
         # Velocity should be damped
         assert obj.vx < initial_vx
 
-    def test_step_zero_velocity(self):
+    def test_step_zero_velocity(self, positioned_obj):
         """
         Scenario: Step with zero velocity
 
@@ -257,15 +281,12 @@ class TestPhysicalObject:
         When calling step
         Then the position should remain unchanged
         """
-        obj = PhysicalObject()
-        obj._x = 10.0
-        obj._y = 20.0
-        obj.step(1.0)
+        positioned_obj.step(1.0)
         # Position shouldn't change
-        assert obj._x == 10.0
-        assert obj._y == 20.0
+        assert positioned_obj._x == 10.0
+        assert positioned_obj._y == 20.0
 
-    def test_step_z_axis(self):
+    def test_step_z_axis(self, obj):
         """
         Scenario: Update z-axis position during step
 
@@ -273,13 +294,12 @@ class TestPhysicalObject:
         When calling step
         Then the z position should be updated
         """
-        obj = PhysicalObject()
         obj.vz = 10.0
         initial_z = obj._z
         obj.step(0.1)
         assert obj._z != initial_z
 
-    def test_multiple_moves(self):
+    def test_multiple_moves(self, obj):
         """
         Scenario: Accumulate multiple move operations
 
@@ -287,13 +307,12 @@ class TestPhysicalObject:
         When calling move multiple times
         Then the position changes should accumulate
         """
-        obj = PhysicalObject()
         obj.move(10, 20)
         obj.move(5, 10)
-        assert obj._x == 15.0
-        assert obj._y == 30.0
+        assert float(obj._x) == pytest.approx(15.0)
+        assert float(obj._y) == pytest.approx(30.0)
 
-    def test_aim_accumulates(self):
+    def test_aim_accumulates(self, obj):
         """
         Scenario: Accumulate velocity from multiple aim calls
 
@@ -301,7 +320,6 @@ class TestPhysicalObject:
         When calling aim multiple times
         Then the velocity changes should accumulate
         """
-        obj = PhysicalObject()
         obj.aim("x", 100.0)
         first_vx = obj.vx
         obj.aim("x", 50.0)
@@ -13,13 +13,20 @@
 ## You should have received a copy of the GNU General Public License
 ## along with this program; if not, see <https://www.gnu.org/licenses/>.
 
-from unittest.mock import Mock, patch
+import inspect
+from unittest.mock import patch
 
 import pytest
 
+# The media object modules import PySide6 at load time; skip rather than
+# fail collection where Qt is not installed.
+pytest.importorskip("PySide6")
+
 from pyzui.objects.mediaobjects.mediaobject import LoadError
 from pyzui.objects.mediaobjects.svgmediaobject import SVGMediaObject
 
+_REQUIRED_API = {"render": "method", "onscreen_size": "property"}
+
 
 class TestSVGMediaObject:
     """
@@ -30,8 +37,7 @@ class TestSVGMediaObject:
     vector graphics with proper scaling and transparency support.
     """
 
-    @patch("pyzui.objects.mediaobjects.svgmediaobject.QtSvg.QSvgRenderer")
-    def test_init_success(self, mock_renderer_class):
+    def test_init_success(self, qsvg, scene):
         """
         Scenario: Initialize with valid SVG file
 
@@ -40,19 +46,12 @@ class TestSVGMediaObject:
         Then the SVG renderer should load the file successfully
         And the object should be initialized
         """
-        mock_renderer = Mock()
-        mock_renderer.load.return_value = True
-        mock_renderer.defaultSize.return_value = Mock(width=lambda: 100, height=lambda: 200)
-        mock_renderer_class.return_value = mock_renderer
-
-        scene = Mock()
         obj = SVGMediaObject("test.svg", scene)
 
         assert obj is not None
-        mock_renderer.load.assert_called_once_with("test.svg")
+        qsvg.return_value.load.assert_called_once_with("test.svg")
 
-    @patch("pyzui.objects.mediaobjects.svgmediaobject.QtSvg.QSvgRenderer")
-    def test_init_load_failure(self, mock_renderer_class):
+    def test_init_load_failure(self, qsvg, scene):
         """
         Scenario: Reject invalid SVG file
 
@@ -61,16 +60,11 @@ class TestSVGMediaObject:
         Then a LoadError should be raised
         And the error message should indicate parsing failure
         """
-        mock_renderer = Mock()
-        mock_renderer.load.return_value = False
-        mock_renderer_class.return_value = mock_renderer
-
-        scene = Mock()
+        qsvg.return_value.load.return_value = False
         with pytest.raises(LoadError, match="unable to parse SVG file"):
             SVGMediaObject("invalid.svg", scene)
 
-    @patch("pyzui.objects.mediaobjects.svgmediaobject.QtSvg.QSvgRenderer")
-    def test_inherits_from_mediaobject(self, mock_renderer_class):
+    def test_inherits_from_mediaobject(self, qsvg, scene):
         """
         Scenario: Verify inheritance from MediaObject
 
@@ -80,12 +74,6 @@ class TestSVGMediaObject:
         """
         from pyzui.objects.mediaobjects.mediaobject import MediaObject
 
-        mock_renderer = Mock()
-        mock_renderer.load.return_value = True
-        mock_renderer.defaultSize.return_value = Mock(width=lambda: 100, height=lambda: 200)
-        mock_renderer_class.return_value = mock_renderer
-
-        scene = Mock()
         obj = SVGMediaObject("test.svg", scene)
 
         assert isinstance(obj, MediaObject)
@@ -100,56 +88,23 @@ class TestSVGMediaObject:
         """
         assert SVGMediaObject.transparent is True
 
-    @patch("pyzui.objects.mediaobjects.svgmediaobject.QtSvg.QSvgRenderer")
-    def test_onscreen_size_property_exists(self, mock_renderer_class):
-        """
-        Scenario: Verify onscreen_size property availability
-
-        Given a SVGMediaObject with dimensions 100x200
-        When checking for the onscreen_size property
-        Then the property should exist
-        """
-        mock_renderer = Mock()
-        mock_renderer.load.return_value = True
-        mock_size = Mock()
-        mock_size.width.return_value = 100
-        mock_size.height.return_value = 200
-        mock_renderer.defaultSize.return_value = mock_size
-        mock_renderer_class.return_value = mock_renderer
-
-        scene = Mock()
-        SVGMediaObject("test.svg", scene)
-
-        # Just verify the property exists (avoids Qt segfault)
-        assert hasattr(SVGMediaObject, "onscreen_size")
-
-    @patch("pyzui.objects.mediaobjects.svgmediaobject.QtSvg.QSvgRenderer")
-    def test_render_method_exists(self, mock_renderer_class):
+    @pytest.mark.parametrize("name,kind", sorted(_REQUIRED_API.items()))
+    def test_public_api(self, name, kind):
         """
-        Scenario: Verify render method availability
+        Scenario: Verify the public rendering API
 
-        Given a SVGMediaObject instance
-        When checking for the render method
-        Then the method should exist
-        And be callable
+        Given the SVGMediaObject class
+        When inspecting each required attribute on the class
+        Then methods should be plain functions
+        And properties should be property objects
         """
-        mock_renderer = Mock()
-        mock_renderer.load.return_value = True
-        mock_size = Mock()
-        mock_size.width.return_value = 100
-        mock_size.height.return_value = 200
-        mock_renderer.defaultSize.return_value = mock_size
-        mock_renderer_class.return_value = mock_renderer
-
-        scene = Mock()
-        obj = SVGMediaObject("test.svg", scene)
-
-        # Just verify the method exists without calling it (avoids Qt segfault)
-        assert hasattr(obj, "render")
-        assert callable(obj.render)
+        attr = inspect.getattr_static(SVGMediaObject, name)
+        if kind == "method":
+            assert inspect.isfunction(attr)
+        else:
+            assert isinstance(attr, property)
 
-    @patch("pyzui.objects.mediaobjects.svgmediaobject.QtSvg.QSvgRenderer")
-    def test_to_dict_method(self, mock_renderer_class):
+    def test_to_dict_method(self, qsvg, scene):
         """
         Scenario: Serialize SVGMediaObject to dictionary
 
@@ -158,15 +113,6 @@ class TestSVGMediaObject:
         Then it should return a dictionary with all object properties
         And include SVG-specific attributes
         """
-        mock_renderer = Mock()
-        mock_renderer.load.return_value = True
-        mock_size = Mock()
-        mock_size.width.return_value = 100
-        mock_size.height.return_value = 200
-        mock_renderer.defaultSize.return_value = mock_size
-        mock_renderer_class.return_value = mock_renderer
-
-        scene = Mock()
         obj = SVGMediaObject("test.svg", scene)
 
         # Use patch to mock the inherited attributes
@@ -189,8 +135,7 @@ class TestSVGMediaObject:
             assert result["height"] == 200
             assert result["transparent"] is True
 
-    @patch("pyzui.objects.mediaobjects.svgmediaobject.QtSvg.QSvgRenderer")
-    def test_from_dict_method(self, mock_renderer_class):
+    def test_from_dict_method(self, qsvg, scene):
         """
         Scenario: Create SVGMediaObject from dictionary
 
@@ -198,15 +143,6 @@ class TestSVGMediaObject:
         When from_dict() is called
         Then it should create a new SVGMediaObject with the same properties
         """
-        mock_renderer = Mock()
-        mock_renderer.load.return_value = True
-        mock_size = Mock()
-        mock_size.width.return_value = 100
-        mock_size.height.return_value = 200
-        mock_renderer.defaultSize.return_value = mock_size
-        mock_renderer_class.return_value = mock_renderer
-
-        scene = Mock()
         data = {
             "type": "SVGMediaObject",
             "media_id": "test.svg",
@@ -226,8 +162,7 @@ class TestSVGMediaObject:
         # Note: We can't directly check private attributes due to type checking
         # but the method should execute without errors
 
-    @patch("pyzui.objects.mediaobjects.svgmediaobject.QtSvg.QSvgRenderer")
-    def test_copy_preserves_svg_properties(self, mock_renderer_class):
+    def test_copy_preserves_svg_properties(self, qsvg, scene):
         """
         Scenario: Copy preserves SVG-specific properties
 
@@ -236,15 +171,6 @@ class TestSVGMediaObject:
         Then the new object should have the same properties
         And SVG-specific attributes should be preserved
         """
-        mock_renderer = Mock()
-        mock_renderer.load.return_value = True
-        mock_size = Mock()
-        mock_size.width.return_value = 100
-        mock_size.height.return_value = 200
-        mock_renderer.defaultSize.return_value = mock_size
-        mock_renderer_class.return_value = mock_renderer
-
-        scene = Mock()
         original = SVGMediaObject("test.svg", scene)
 
         # Simulate copy by serializing and deserializing
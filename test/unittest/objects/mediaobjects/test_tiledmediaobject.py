@@ -13,7 +13,9 @@
 ## You should have received a copy of the GNU General Public License
 ## along with this program; if not, see <https://www.gnu.org/licenses/>.
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
+
+import pytest
 
 from pyzui.objects.mediaobjects.tiledmediaobject import TiledMediaObject
 
@@ -27,9 +29,17 @@ class TestTiledMediaObject:
     on-demand loading of image tiles at different zoom levels.
     """
 
-    @patch("pyzui.objects.mediaobjects.tiledmediaobject.TileManager.tiled")
-    @patch("pyzui.objects.mediaobjects.tiledmediaobject.TileManager.load_tile")
-    def test_init_already_tiled(self, mock_load, mock_tiled):
+    @pytest.fixture(autouse=True)
+    def _tm_patches(self, tilemanager, monkeypatch):
+        """Stub TileManager and the temp-file calls made when media needs tiling.
+
+        Applied once per test for the whole class; tests that need media to be
+        untiled set ``tilemanager.tiled.return_value = False``.
+        """
+        monkeypatch.setattr("tempfile.mkstemp", Mock(return_value=(1, "/tmp/test.ppm")))
+        monkeypatch.setattr("os.close", Mock())
+
+    def test_init_already_tiled(self, scene):
         """
         Scenario: Initialize with pre-tiled media
 
@@ -38,15 +48,10 @@ class TestTiledMediaObject:
         Then the object should initialize successfully
         And use existing tiles without re-tiling
         """
-        mock_tiled.return_value = True
-        scene = Mock()
         obj = TiledMediaObject("test.jpg", scene)
         assert obj is not None
 
-    @patch("pyzui.objects.mediaobjects.tiledmediaobject.TileManager.tiled")
-    @patch("tempfile.mkstemp")
-    @patch("os.close")
-    def test_init_needs_tiling(self, mock_close, mock_mkstemp, mock_tiled):
+    def test_init_needs_tiling(self, tilemanager, scene):
         """
         Scenario: Initialize media that requires tiling
 
@@ -55,9 +60,7 @@ class TestTiledMediaObject:
         Then temporary files should be created for tiling
         And the object should initialize successfully
         """
-        mock_tiled.return_value = False
-        mock_mkstemp.return_value = (1, "/tmp/test.ppm")
-        scene = Mock()
+        tilemanager.tiled.return_value = False
         obj = TiledMediaObject("test.jpg", scene)
         assert obj is not None
 
@@ -91,8 +94,7 @@ class TestTiledMediaObject:
         """
         assert TiledMediaObject.tempcache == 5
 
-    @patch("pyzui.objects.mediaobjects.tiledmediaobject.TileManager.tiled")
-    def test_inherits_from_mediaobject(self, mock_tiled):
+    def test_inherits_from_mediaobject(self, scene):
         """
         Scenario: Verify inheritance from MediaObject
 
@@ -102,14 +104,10 @@ class TestTiledMediaObject:
         """
         from pyzui.objects.mediaobjects.mediaobject import MediaObject
 
-        mock_tiled.return_value = True
-        with patch("pyzui.objects.mediaobjects.tiledmediaobject.TileManager.load_tile"):
-            scene = Mock()
-            obj = TiledMediaObject("test.jpg", scene)
-            assert isinstance(obj, MediaObject)
+        obj = TiledMediaObject("test.jpg", scene)
+        assert isinstance(obj, MediaObject)
 
-    @patch("pyzui.objects.mediaobjects.tiledmediaobject.TileManager.tiled")
-    def test_onscreen_size_property(self, mock_tiled):
+    def test_onscreen_size_property(self, fresh_scene):
         """
         Scenario: Calculate on-screen size at zoom level
 
@@ -117,12 +115,9 @@ class TestTiledMediaObject:
         When accessing the onscreen_size property
         Then it should return a tuple with (width, height)
         """
-        mock_tiled.return_value = True
-        with patch("pyzui.objects.mediaobjects.tiledmediaobject.TileManager.load_tile"):
-            scene = Mock()
-            scene.zoomlevel = 0
-            obj = TiledMediaObject("test.jpg", scene)
-            obj.zoomlevel = 0
-            size = obj.onscreen_size
-            assert isinstance(size, tuple)
-            assert len(size) == 2
+        fresh_scene.zoomlevel = 0
+        obj = TiledMediaObject("test.jpg", fresh_scene)
+        obj.zoomlevel = 0
+        size = obj.onscreen_size
+        assert isinstance(size, tuple)
+        assert len(size) == 2
@@ -13,6 +13,9 @@
 ## You should have received a copy of the GNU General Public License
 ## along with this program; if not, see <https://www.gnu.org/licenses/>.
 
+import pyzui.objects.scene.qzui
+from pyzui.objects.scene.qzui import QZUI
+
 
 class TestQZUI:
     """
@@ -22,36 +25,12 @@ class TestQZUI:
     defined within the PyZUI scene system.
     """
 
-    def test_module_exists(self):
+    def test_imports(self):
         """
-        Scenario: Verify qzui module exists
+        Scenario: Import the qzui module and its QZUI class
 
         Given the PyZUI scene system
-        When importing the qzui module
-        Then the module should be successfully imported
-        """
-        import pyzui.objects.scene.qzui
-
-        assert pyzui.objects.scene.qzui is not None
-
-    def test_qzui_class_exists(self):
-        """
-        Scenario: Verify QZUI class exists
-
-        Given the qzui module
-        When checking for the QZUI class
-        Then the class should be defined
-        """
-        from pyzui.objects.scene.qzui import QZUI
-
-        assert QZUI is not None
-
-    def test_placeholder(self):
-        """
-        Scenario: Placeholder test for future implementation
-
-        Given the test suite structure
-        When running placeholder tests
-        Then they should pass to maintain test suite integrity
+        When importing pyzui.objects.scene.qzui
+        Then the module should be imported and define the QZUI class
         """
-        assert True
+        assert pyzui.objects.scene.qzui.QZUI is QZUI
@@ -14,10 +14,48 @@
 ## along with this program; if not, see <https://www.gnu.org/licenses/>.
 
 import math
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, mock_open, patch
 
 import pytest
 
+import pyzui.objects.scene.scene
+from pyzui.objects.mediaobjects import mediaobject as MediaObject
+from pyzui.objects.scene.scene import Scene
+
+
+class _RenderOrderMediaObject:
+    """Minimal media object that appends its name to render_order when drawn."""
+
+    __slots__ = ("_area", "_bottomright", "_topleft", "name", "render_order", "vzmoving")
+
+    def __init__(self, render_order, name, area):
+        self.render_order = render_order
+        self.name = name
+        self._area = area
+        self._topleft = (100, 100)
+        self._bottomright = (200, 200)
+        self.vzmoving = False  # Required attribute for Scene.vzmoving property
+
+    @property
+    def onscreen_area(self):
+        return self._area
+
+    @property
+    def topleft(self):
+        return self._topleft
+
+    @property
+    def bottomright(self):
+        return self._bottomright
+
+    def render(self, painter, mode):
+        if mode != MediaObject.RenderMode.Invisible:
+            self.render_order.append(self.name)
+
+    def is_size_visible(self, mode):
+        # Always visible unless explicitly rendered invisible
+        return mode != MediaObject.RenderMode.Invisible
+
 
 class TestScene:
     """
@@ -27,39 +65,15 @@ class TestScene:
     defined within the PyZUI scene system.
     """
 
-    def test_module_exists(self):
+    def test_imports(self):
         """
-        Scenario: Verify scene module exists
+        Scenario: Import the scene module and its Scene class
 
         Given the PyZUI scene system
-        When importing the scene module
-        Then the module should be successfully imported
+        When importing pyzui.objects.scene.scene
+        Then the module should be imported and define the Scene class
         """
-        import pyzui.objects.scene.scene
-
-        assert pyzui.objects.scene.scene is not None
-
-    def test_scene_class_exists(self):
-        """
-        Scenario: Verify Scene class exists
-
-        Given the scene module
-        When checking for the Scene class
-        Then the class should be defined
-        """
-        from pyzui.objects.scene.scene import Scene
-
-        assert Scene is not None
-
-    def test_placeholder(self):
-        """
-        Scenario: Placeholder test for future implementation
-
-        Given the test suite structure
-        When running placeholder tests
-        Then they should pass to maintain test suite integrity
-        """
-        assert True
+        assert pyzui.objects.scene.scene.Scene is Scene
 
     def test_render_order_smaller_objects_on_top(self):
         """
@@ -71,9 +85,6 @@ class TestScene:
         When the scene is rendered
         Then smaller objects should be rendered after (on top of) larger objects
         """
-        from pyzui.objects.mediaobjects import mediaobject as MediaObject
-        from pyzui.objects.scene.scene import Scene
-
         # Create a scene with smaller_on_top (default)
         scene = Scene()
         assert scene.render_order == "smaller_on_top"
@@ -82,39 +93,10 @@ class TestScene:
         # Track render order
         render_order = []
 
-        # Create mock media objects with different sizes
-        class MockMediaObject:
-            def __init__(self, name, area):
-                self.name = name
-                self._area = area
-                self._topleft = (100, 100)
-                self._bottomright = (200, 200)
-                self.vzmoving = False  # Required attribute for Scene.vzmoving property
-
-            @property
-            def onscreen_area(self):
-                return self._area
-
-            @property
-            def topleft(self):
-                return self._topleft
-
-            @property
-            def bottomright(self):
-                return self._bottomright
-
-            def render(self, painter, mode):
-                if mode != MediaObject.RenderMode.Invisible:
-                    render_order.append(self.name)
-
-            def is_size_visible(self, mode):
-                # Mock implementation - always visible
-                return mode != MediaObject.RenderMode.Invisible
-
         # Create objects: large (1000), medium (500), small (100)
-        large_obj = MockMediaObject("large", 1000)
-        medium_obj = MockMediaObject("medium", 500)
-        small_obj = MockMediaObject("small", 100)
+        large_obj = _RenderOrderMediaObject(render_order, "large", 1000)
+        medium_obj = _RenderOrderMediaObject(render_order, "medium", 500)
+        small_obj = _RenderOrderMediaObject(render_order, "small", 100)
 
         # Add in random order
         scene.add(medium_obj)
@@ -143,9 +125,6 @@ class TestScene:
         When the scene is rendered
         Then larger objects should be rendered after (on top of) smaller objects
         """
-        from pyzui.objects.mediaobjects import mediaobject as MediaObject
-        from pyzui.objects.scene.scene import Scene
-
         # Create a scene and set render order to larger_on_top
         scene = Scene()
         scene.set_render_order("larger_on_top")
@@ -155,38 +134,10 @@ class TestScene:
         # Track render order
         render_order = []
 
-        # Create mock media objects with different sizes
-        class MockMediaObject:
-            def __init__(self, name, area):
-                self.name = name
-                self._area = area
-                self._topleft = (100, 100)
-                self._bottomright = (200, 200)
-                self.vzmoving = False
-
-            @property
-            def onscreen_area(self):
-                return self._area
-
-            @property
-            def topleft(self):
-                return self._topleft
-
-            @property
-            def bottomright(self):
-                return self._bottomright
-
-            def render(self, painter, mode):
-                if mode != MediaObject.RenderMode.Invisible:
-                    render_order.append(self.name)
-
-            def is_size_visible(self, mode):
-                return mode != MediaObject.RenderMode.Invisible
-
         # Create objects: large (1000), medium (500), small (100)
-        large_obj = MockMediaObject("large", 1000)
-        medium_obj = MockMediaObject("medium", 500)
-        small_obj = MockMediaObject("small", 100)
+        large_obj = _RenderOrderMediaObject(render_order, "large", 1000)
+        medium_obj = _RenderOrderMediaObject(render_order, "medium", 500)
+        small_obj = _RenderOrderMediaObject(render_order, "small", 100)
 
         # Add in random order
         scene.add(medium_obj)
@@ -213,44 +164,14 @@ class TestScene:
         When render_order is changed at runtime
         Then the next render pass uses the new order
         """
-        from pyzui.objects.mediaobjects import mediaobject as MediaObject
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         scene.viewport_size = (800, 600)
 
         render_order = []
 
-        class MockMediaObject:
-            def __init__(self, name, area):
-                self.name = name
-                self._area = area
-                self._topleft = (100, 100)
-                self._bottomright = (200, 200)
-                self.vzmoving = False
-
-            @property
-            def onscreen_area(self):
-                return self._area
-
-            @property
-            def topleft(self):
-                return self._topleft
-
-            @property
-            def bottomright(self):
-                return self._bottomright
-
-            def render(self, painter, mode):
-                if mode != MediaObject.RenderMode.Invisible:
-                    render_order.append(self.name)
-
-            def is_size_visible(self, mode):
-                return mode != MediaObject.RenderMode.Invisible
-
-        large_obj = MockMediaObject("large", 1000)
-        medium_obj = MockMediaObject("medium", 500)
-        small_obj = MockMediaObject("small", 100)
+        large_obj = _RenderOrderMediaObject(render_order, "large", 1000)
+        medium_obj = _RenderOrderMediaObject(render_order, "medium", 500)
+        small_obj = _RenderOrderMediaObject(render_order, "small", 100)
 
         scene.add(large_obj)
         scene.add(medium_obj)
@@ -282,8 +203,6 @@ class TestScene:
         When getting and setting render_order
         Then valid values are accepted and invalid values raise ValueError
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
 
         # Default
@@ -308,8 +227,6 @@ class TestScene:
         When a Scene is created with that config
         Then the scene's render_order should be 'larger_on_top'
         """
-        from pyzui.objects.scene.scene import Scene
-
         # Scene with larger_on_top config
         scene = Scene(config={"render": {"order": "larger_on_top"}})
         assert scene.render_order == "larger_on_top"
@@ -330,8 +247,6 @@ class TestScene:
         When a single object is removed
         Then only that object should be removed from the scene
         """
-        from pyzui.objects.scene.scene import Scene
-
         # Create a scene
         scene = Scene()
 
@@ -375,8 +290,6 @@ class TestScene:
         When a list of objects is removed
         Then all objects in the list should be removed from the scene
         """
-        from pyzui.objects.scene.scene import Scene
-
         # Create a scene
         scene = Scene()
 
@@ -417,7 +330,6 @@ class TestScene:
         When objects are removed
         Then media ID cleanup should only purge when no objects remain with that ID
         """
-        from pyzui.objects.scene.scene import Scene
         from pyzui.tilesystem import tilemanager as TileManager
 
         # Create a scene
@@ -478,10 +390,6 @@ class TestScene:
         When importing a scene from a PZS file
         Then the imported mediaobjects should be added to the current scene
         """
-        from unittest.mock import mock_open, patch
-
-        from pyzui.objects.scene.scene import Scene
-
         # Create a scene with some initial mediaobjects
         scene = Scene()
         scene.viewport_size = (800, 600)
@@ -547,10 +455,6 @@ StringMediaObject\tTest String\t0.5\t-20.0\t10.0
         When importing the scene
         Then no mediaobjects should be added
         """
-        from unittest.mock import mock_open, patch
-
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         scene.viewport_size = (800, 600)
         scene.zoomlevel = 1.0
@@ -574,8 +478,6 @@ StringMediaObject\tTest String\t0.5\t-20.0\t10.0
         When attempting to import the scene
         Then FileNotFoundError should be raised
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
 
         with pytest.raises(FileNotFoundError):
@@ -589,10 +491,6 @@ StringMediaObject\tTest String\t0.5\t-20.0\t10.0
         When attempting to import the scene
         Then ValueError should be raised
         """
-        from unittest.mock import mock_open, patch
-
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
 
         # Malformed PZS file (missing values in header)
@@ -609,10 +507,6 @@ StringMediaObject\tTest String\t0.5\t-20.0\t10.0
         When importing a scene with mediaobjects having the same media_id
         Then duplicates should be added (not skipped)
         """
-        from unittest.mock import mock_open, patch
-
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         scene.viewport_size = (800, 600)
         scene.zoomlevel = 1.0
@@ -655,8 +549,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When _fit_imported_objects is called
         Then object positions and zoomlevels should be scaled to fill the viewport
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         scene.viewport_size = (800, 600)
         scene.origin = (0, 0)
@@ -684,8 +576,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When _fit_imported_objects is called
         Then object positions and zoomlevels should be decreased to fit the viewport
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         scene.viewport_size = (800, 600)
         scene.origin = (0, 0)
@@ -713,8 +603,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When _fit_imported_objects is called
         Then no error should be raised
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         scene.viewport_size = (800, 600)
 
@@ -729,8 +617,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When _fit_imported_objects is called
         Then no error should be raised (objects keep their original zoomlevels)
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         scene.viewport_size = (0, 0)
 
@@ -755,8 +641,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When _fit_imported_objects is called
         Then the difference in zoomlevels should be preserved
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         scene.viewport_size = (800, 600)
         scene.origin = (0, 0)
@@ -789,8 +673,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When _fit_imported_objects is called
         Then positions should be scaled relative to the group centroid
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         scene.viewport_size = (2000, 2000)
         scene.origin = (0, 0)
@@ -831,8 +713,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When _fit_imported_objects is called
         Then scaling uses the combined bounding box of all objects
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         scene.viewport_size = (800, 600)
         scene.origin = (0, 0)
@@ -875,10 +755,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When saving the selection
         Then only selected objects should be saved with "0 0 0" header
         """
-        from unittest.mock import patch
-
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
 
         # Create mock mediaobjects
@@ -929,10 +805,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When saving the selection
         Then the object should be saved with position (0, 0) relative to itself
         """
-        from unittest.mock import patch
-
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
 
         # Create mock mediaobject
@@ -975,10 +847,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When attempting to save selection
         Then warning should be logged and no file should be written
         """
-        from unittest.mock import patch
-
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
 
         # No selection set
@@ -1004,10 +872,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When saving the selection
         Then saved positions should be offsets from centroid
         """
-        from unittest.mock import patch
-
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
 
         # Create mock mediaobjects forming a square
@@ -1087,10 +951,6 @@ TiledMediaObject\timage.jpg\t1.0\t0.0\t0.0
         When saving the selection
         Then file should have correct tab-separated format
         """
-        from unittest.mock import patch
-
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
 
         # Create mock mediaobject
@@ -1150,8 +1010,6 @@ class TestSceneShutdownThreads:
         When shutdown_threads() is called
         Then the parallel renderer's shutdown() method should be invoked
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         mock_renderer = Mock()
         scene._Scene__parallel_renderer = mock_renderer
@@ -1168,8 +1026,6 @@ class TestSceneShutdownThreads:
         When shutdown_threads() is called
         Then no error should occur
         """
-        from pyzui.objects.scene.scene import Scene
-
         scene = Scene()
         try:
             scene.shutdown_threads()
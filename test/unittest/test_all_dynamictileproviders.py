@@ -30,62 +30,125 @@ To add a new provider, simply create a file matching *dynamictileprovider.py
 in the tileproviders directory - it will be automatically discovered and tested.
 """
 
+import ast
 import importlib
-import inspect
-from pathlib import Path
+import os
+import sys
 from unittest.mock import Mock, patch
 
 import pytest
 
 # Import base classes
+from pyzui.tilesystem import tileproviders
 from pyzui.tilesystem.tileproviders import DynamicTileProvider
 
 # =============================================================================
 # PROVIDER DISCOVERY
 # =============================================================================
 
+# Directory of the already-imported tileproviders package, so discovery lists the
+# same files that importlib will load instead of a path relative to this test file
+_TILEPROVIDERS_DIR = tileproviders.__path__[0]
 
-def discover_dynamic_providers() -> list[tuple[str, type]]:
+
+def _declares_provider_class(filepath: str) -> bool:
     """
-    Discover all DynamicTileProvider implementations automatically.
+    Check whether a provider file declares a class on top of DynamicTileProvider, without
+    importing it.
 
     Returns:
-        List of tuples: [(provider_name, ProviderClass), ...]
+        True if any class's bases name DynamicTileProvider, either directly, under an alias
+        it was imported as or through a class imported from another provider module
+    """
+    with open(filepath, "rb") as f:
+        tree = ast.parse(f.read(), filename=filepath)
+
+    bases = {"DynamicTileProvider"}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            # `from .dynamictileprovider import DynamicTileProvider as Base` and
+            # `from .foodynamictileprovider import FooTileProvider` both name a provider base
+            from_provider_module = (node.module or "").endswith("dynamictileprovider")
+            for alias in node.names:
+                if alias.name in bases or from_provider_module:
+                    bases.add(alias.asname or alias.name)
+
+        elif isinstance(node, ast.ClassDef):
+            # Accept both `DynamicTileProvider` and `module.DynamicTileProvider`
+            if any(
+                (base.id if isinstance(base, ast.Name) else getattr(base, "attr", None)) in bases
+                for base in node.bases
+            ):
+                return True
+
+    return False
+
+
+def _provider_filenames(tileproviders_dir: str) -> list[str]:
+    """
+    List the provider files in a tileproviders directory.
 
-    Scans pyzui/tilesystem/tileproviders/ for files matching *dynamictileprovider.py
-    and extracts classes that inherit from DynamicTileProvider.
+    Returns:
+        Sorted list of the names of every regular *dynamictileprovider.py file except the
+        base dynamictileprovider.py
     """
-    providers = []
+    with os.scandir(tileproviders_dir) as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith("dynamictileprovider.py")
+            and entry.name != "dynamictileprovider.py"
+            and entry.is_file(follow_symlinks=False)
+        )
 
-    # Get the tileproviders directory path
-    tileproviders_dir = Path(__file__).parent.parent.parent / "pyzui" / "tilesystem" / "tileproviders"
 
-    # Find all *dynamictileprovider.py files
-    for filepath in tileproviders_dir.glob("*dynamictileprovider.py"):
-        module_name = filepath.stem  # filename without .py
+def discover_dynamic_providers() -> list[tuple[str, type]]:
+    """
+    Discover all DynamicTileProvider implementations automatically.
 
-        # Skip the base DynamicTileProvider itself
-        if module_name == "dynamictileprovider":
-            continue
+    Returns:
+        List of tuples: [(provider_name, ProviderClass), ...]
 
+    Scans pyzui/tilesystem/tileproviders/ for files matching *dynamictileprovider.py
+    and extracts classes that inherit from DynamicTileProvider. Files are parsed
+    first, and a file that declares no provider class fails the collection rather
+    than silently dropping out of the contract tests.
+    """
+    # Find all *dynamictileprovider.py files; each must declare a provider class
+    module_names = []
+    for filename in _provider_filenames(_TILEPROVIDERS_DIR):
+        filepath = os.path.join(_TILEPROVIDERS_DIR, filename)
+        module_name = filename.removesuffix(".py")
+
+        if not _declares_provider_class(filepath):
+            pytest.fail(f"{filename} matches *dynamictileprovider.py but declares no DynamicTileProvider subclass")
+        module_names.append(module_name)
+
+    # Import the modules dynamically; the package is already in sys.modules, so each
+    # child module is found from its __path__ without a sys.path search
+    imported_modules = set()
+    for module_name in module_names:
         try:
-            # Import the module dynamically
-            module = importlib.import_module(f"pyzui.tilesystem.tileproviders.{module_name}")
-
-            # Find all classes in the module that inherit from DynamicTileProvider
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                # Skip the DynamicTileProvider base class itself
-                if obj is DynamicTileProvider:
-                    continue
-
-                # Check if it's a subclass of DynamicTileProvider
-                if issubclass(obj, DynamicTileProvider) and obj.__module__ == module.__name__:
-                    providers.append((name, obj))
-
+            module = importlib.import_module(f"{tileproviders.__name__}.{module_name}")
         except Exception as e:
             pytest.fail(f"Failed to import {module_name}: {e}")
+        imported_modules.add(module.__name__)
 
-    return providers
+    # Walk the subclass tree the interpreter already tracks rather than every module
+    # attribute; subclasses defined elsewhere (e.g. in other tests) are filtered out
+    providers = []
+    seen = set()
+    pending = list(DynamicTileProvider.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        pending.extend(cls.__subclasses__())
+        if cls.__module__ in imported_modules:
+            providers.append((cls.__name__, cls))
+
+    return sorted(providers, key=lambda provider: (provider[1].__module__, provider[0]))
 
 
 # Discover all providers at module load time
@@ -94,11 +157,63 @@ DISCOVERED_PROVIDERS = discover_dynamic_providers()
 # Create parameter list for pytest (provider_name for test IDs)
 PROVIDER_PARAMS = [(name, cls) for name, cls in DISCOVERED_PROVIDERS]
 
+# media_id for each provider, derived once from its name, e.g. FernTileProvider -> "fern"
+MEDIA_IDS = {name: name.lower().replace("tileprovider", "").replace("dynamic", "") for name, _ in DISCOVERED_PROVIDERS}
+
+# PIL Image module as seen by each provider's module, i.e. the patch.object target for Image.new
+IMAGE_MODULES = {name: getattr(sys.modules[cls.__module__], "Image", None) for name, cls in DISCOVERED_PROVIDERS}
+
 # =============================================================================
 # PARAMETRIZED TESTS - RUN FOR ALL DISCOVERED PROVIDERS
 # =============================================================================
 
 
+# Providers only store the tilecache they are given, so every provider shares one
+# attribute-less Mock; spec=[] makes any unexpected use of it fail loudly
+_SHARED_TILECACHE = Mock(spec=[])
+
+# Largest valid row/col index at tilelevel 2, i.e. 2**2 - 1
+_LEVEL2_MAX = (1 << 2) - 1
+
+# (tilelevel, row, col, label) rows for _load_dynamic() boundary checks; valid coords at
+# tilelevel 2 are 0.._LEVEL2_MAX (= 3)
+BOUNDARY_CASES = [
+    (2, -1, 1, "negative_row"),
+    (2, 1, -1, "negative_col"),
+    (2, _LEVEL2_MAX + 1, 1, "row_out_of_range"),
+    (2, 1, _LEVEL2_MAX + 1, "col_out_of_range"),
+    (2, 10, 10, "both_out_of_range"),
+]
+
+
+# (attribute, type, predicate, requirement) rows for the class attributes every provider must define
+CONTRACT = [
+    ("filext", str, lambda v: len(v) > 0, "a non-empty string"),
+    ("tilesize", int, lambda v: v > 0, "a positive integer"),
+    ("aspect_ratio", (int, float), lambda v: v > 0, "a positive number"),
+]
+
+
+@pytest.fixture(scope="class", params=PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
+def provider_fixture(request):
+    """
+    One provider instance per (test class, provider), shared by that class's tests.
+
+    Returns:
+        Tuple of (provider_name, provider_class, provider)
+    """
+    provider_name, provider_class = request.param
+    return provider_name, provider_class, provider_class(_SHARED_TILECACHE)
+
+
+@pytest.fixture(scope="class")
+def media_id(provider_fixture):
+    """
+    Precomputed media_id for the current provider (see MEDIA_IDS).
+    """
+    return MEDIA_IDS[provider_fixture[0]]
+
+
 class TestAllDynamicTileProviders:
     """
     Feature: Automated DynamicTileProvider Discovery and Testing
@@ -111,8 +226,8 @@ class TestAllDynamicTileProviders:
     # SECTION 1: BASIC INITIALIZATION & STRUCTURE
     # -------------------------------------------------------------------------
 
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_provider_initialization(self, provider_name, provider_class):
+    @pytest.mark.smoke
+    def test_provider_initialization(self, provider_fixture):
         """
         Scenario: Initialize provider with tilecache
 
@@ -120,12 +235,11 @@ class TestAllDynamicTileProviders:
         When instantiating the provider
         Then the provider object should be created successfully
         """
-        tilecache = Mock()
-        provider = provider_class(tilecache)
+        provider_name, _provider_class, provider = provider_fixture
         assert provider is not None, f"{provider_name} failed to initialize"
 
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_provider_inherits_from_dynamictileprovider(self, provider_name, provider_class):
+    @pytest.mark.smoke
+    def test_provider_inherits_from_dynamictileprovider(self, provider_fixture):
         """
         Scenario: Verify provider inheritance
 
@@ -133,168 +247,37 @@ class TestAllDynamicTileProviders:
         When checking its type hierarchy
         Then it should be an instance of DynamicTileProvider
         """
-        tilecache = Mock()
-        provider = provider_class(tilecache)
+        provider_name, _provider_class, provider = provider_fixture
         assert isinstance(provider, DynamicTileProvider), f"{provider_name} does not inherit from DynamicTileProvider"
 
     # -------------------------------------------------------------------------
-    # SECTION 2: REQUIRED CLASS ATTRIBUTES
+    # SECTION 2: BOUNDARY CONDITION TESTS FOR _load_dynamic()
     # -------------------------------------------------------------------------
 
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_provider_has_filext(self, provider_name, provider_class):
-        """
-        Scenario: Verify filext attribute exists and is valid
-
-        Given a discovered provider class
-        When checking for the filext attribute
-        Then it should exist as a non-empty string
-        """
-        assert hasattr(provider_class, "filext"), f"{provider_name} missing 'filext' attribute"
-        assert isinstance(provider_class.filext, str), f"{provider_name}.filext must be a string"
-        assert len(provider_class.filext) > 0, f"{provider_name}.filext cannot be empty"
-
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_provider_has_tilesize(self, provider_name, provider_class):
-        """
-        Scenario: Verify tilesize attribute exists and is valid
-
-        Given a discovered provider class
-        When checking for the tilesize attribute
-        Then it should exist as a positive integer
-        """
-        assert hasattr(provider_class, "tilesize"), f"{provider_name} missing 'tilesize' attribute"
-        assert isinstance(provider_class.tilesize, int), f"{provider_name}.tilesize must be an integer"
-        assert provider_class.tilesize > 0, f"{provider_name}.tilesize must be positive"
-
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_provider_has_aspect_ratio(self, provider_name, provider_class):
-        """
-        Scenario: Verify aspect_ratio attribute exists and is valid
-
-        Given a discovered provider class
-        When checking for the aspect_ratio attribute
-        Then it should exist as a positive number
-        """
-        assert hasattr(provider_class, "aspect_ratio"), f"{provider_name} missing 'aspect_ratio' attribute"
-        assert isinstance(provider_class.aspect_ratio, (int, float)), f"{provider_name}.aspect_ratio must be a number"
-        assert provider_class.aspect_ratio > 0, f"{provider_name}.aspect_ratio must be positive"
-
-    # -------------------------------------------------------------------------
-    # SECTION 3: BOUNDARY CONDITION TESTS FOR _load_dynamic()
-    # -------------------------------------------------------------------------
-
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_load_dynamic_handles_negative_row(self, provider_name, provider_class):
+    @pytest.mark.parametrize("case", BOUNDARY_CASES, ids=[label for *_, label in BOUNDARY_CASES])
+    def test_load_dynamic_handles_out_of_range(self, provider_fixture, media_id, case, tmp_path):
         """
-        Scenario: Handle negative row coordinate
+        Scenario: Handle tile coordinates outside the valid range
 
-        Given a provider instance and a tile_id with negative row
+        Given a provider instance and a tile_id whose row and/or column is negative
+            or exceeds 2^tilelevel - 1
         When calling _load_dynamic
         Then it should return None gracefully
         """
-        tilecache = Mock()
-        provider = provider_class(tilecache)
+        provider_name, _provider_class, provider = provider_fixture
+        tilelevel, row, col, label = case
 
-        # Extract media_id from provider name (lowercase)
-        media_id = provider_name.lower().replace("tileprovider", "").replace("dynamic", "")
-
-        tile_id = (media_id, 2, -1, 1)  # negative row
-        outfile = "/tmp/test_tile.png"
+        tile_id = (media_id, tilelevel, row, col)
+        outfile = str(tmp_path / "test_tile.png")
 
         result = provider._load_dynamic(tile_id, outfile)
-        assert result is None, f"{provider_name}._load_dynamic() should return None for negative row"
-
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_load_dynamic_handles_negative_col(self, provider_name, provider_class):
-        """
-        Scenario: Handle negative column coordinate
-
-        Given a provider instance and a tile_id with negative column
-        When calling _load_dynamic
-        Then it should return None gracefully
-        """
-        tilecache = Mock()
-        provider = provider_class(tilecache)
-
-        media_id = provider_name.lower().replace("tileprovider", "").replace("dynamic", "")
-
-        tile_id = (media_id, 2, 1, -1)  # negative col
-        outfile = "/tmp/test_tile.png"
-
-        result = provider._load_dynamic(tile_id, outfile)
-        assert result is None, f"{provider_name}._load_dynamic() should return None for negative col"
-
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_load_dynamic_handles_row_out_of_range(self, provider_name, provider_class):
-        """
-        Scenario: Handle row coordinate exceeding valid range
-
-        Given a provider instance and a tile_id with row exceeding 2^tilelevel - 1
-        When calling _load_dynamic
-        Then it should return None gracefully
-        """
-        tilecache = Mock()
-        provider = provider_class(tilecache)
-
-        media_id = provider_name.lower().replace("tileprovider", "").replace("dynamic", "")
-
-        tilelevel = 2
-        max_valid_coord = 2**tilelevel - 1  # = 3
-        tile_id = (media_id, tilelevel, max_valid_coord + 1, 1)
-        outfile = "/tmp/test_tile.png"
-
-        result = provider._load_dynamic(tile_id, outfile)
-        assert result is None, f"{provider_name}._load_dynamic() should return None for row out of range"
-
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_load_dynamic_handles_col_out_of_range(self, provider_name, provider_class):
-        """
-        Scenario: Handle column coordinate exceeding valid range
-
-        Given a provider instance and a tile_id with column exceeding 2^tilelevel - 1
-        When calling _load_dynamic
-        Then it should return None gracefully
-        """
-        tilecache = Mock()
-        provider = provider_class(tilecache)
-
-        media_id = provider_name.lower().replace("tileprovider", "").replace("dynamic", "")
-
-        tilelevel = 2
-        max_valid_coord = 2**tilelevel - 1  # = 3
-        tile_id = (media_id, tilelevel, 1, max_valid_coord + 1)
-        outfile = "/tmp/test_tile.png"
-
-        result = provider._load_dynamic(tile_id, outfile)
-        assert result is None, f"{provider_name}._load_dynamic() should return None for col out of range"
-
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_load_dynamic_handles_both_coords_out_of_range(self, provider_name, provider_class):
-        """
-        Scenario: Handle both coordinates out of range
-
-        Given a provider instance and a tile_id with both row and column out of range
-        When calling _load_dynamic
-        Then it should return None gracefully
-        """
-        tilecache = Mock()
-        provider = provider_class(tilecache)
-
-        media_id = provider_name.lower().replace("tileprovider", "").replace("dynamic", "")
-
-        tile_id = (media_id, 2, 10, 10)  # both exceed max of 3
-        outfile = "/tmp/test_tile.png"
-
-        result = provider._load_dynamic(tile_id, outfile)
-        assert result is None, f"{provider_name}._load_dynamic() should return None for both coords out of range"
+        assert result is None, f"{provider_name}._load_dynamic() should return None for {label.replace('_', ' ')}"
 
     # -------------------------------------------------------------------------
-    # SECTION 4: VALID TILE GENERATION TEST
+    # SECTION 3: VALID TILE GENERATION TEST
     # -------------------------------------------------------------------------
 
-    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
-    def test_load_dynamic_generates_valid_tile(self, provider_name, provider_class):
+    def test_load_dynamic_generates_valid_tile(self, provider_fixture, media_id, tmp_path):
         """
         Scenario: Generate a valid tile for valid coordinates
 
@@ -303,20 +286,16 @@ class TestAllDynamicTileProviders:
         Then an image should be created with correct dimensions
         And the image should be saved to the output file
         """
-        tilecache = Mock()
-        provider = provider_class(tilecache)
-
-        # Determine the module path for patching
-        module_path = provider_class.__module__
+        provider_name, _provider_class, provider = provider_fixture
+        image_module = IMAGE_MODULES[provider_name]
+        assert image_module is not None, f"{provider_name}'s module must import PIL.Image"
 
-        with patch(f"{module_path}.Image.new") as mock_image_new:
-            mock_image = Mock()
-            mock_image_new.return_value = mock_image
+        mock_image = Mock()
 
-            media_id = provider_name.lower().replace("tileprovider", "").replace("dynamic", "")
+        with patch.object(image_module, "new", return_value=mock_image) as mock_image_new:
 
             tile_id = (media_id, 2, 1, 1)  # valid coordinates
-            outfile = "/tmp/test_tile.png"
+            outfile = str(tmp_path / "test_tile.png")
 
             # Call the method
             provider._load_dynamic(tile_id, outfile)
@@ -331,6 +310,36 @@ class TestAllDynamicTileProviders:
             )
 
 
+class TestDynamicTileProviderAttributes:
+    """
+    Feature: Required DynamicTileProvider Class Attributes
+
+    These checks only read class attributes, so they take the discovered class and never build an instance.
+    """
+
+    # -------------------------------------------------------------------------
+    # REQUIRED CLASS ATTRIBUTES
+    # -------------------------------------------------------------------------
+
+    @pytest.mark.smoke
+    @pytest.mark.parametrize("provider_name,provider_class", PROVIDER_PARAMS, ids=[name for name, _ in PROVIDER_PARAMS])
+    def test_provider_contract(self, provider_name, provider_class):
+        """
+        Scenario: Verify filext, tilesize and aspect_ratio exist and are valid
+
+        Given a discovered provider class
+        When checking each attribute in CONTRACT
+        Then filext should be a non-empty string
+        And tilesize should be a positive integer
+        And aspect_ratio should be a positive number
+        """
+        for attr, expected_type, predicate, requirement in CONTRACT:
+            assert hasattr(provider_class, attr), f"{provider_name} missing '{attr}' attribute"
+            value = getattr(provider_class, attr)
+            assert isinstance(value, expected_type), f"{provider_name}.{attr} must be {requirement}"
+            assert predicate(value), f"{provider_name}.{attr} must be {requirement}"
+
+
 # =============================================================================
 # DISCOVERY VERIFICATION TEST
 # =============================================================================
@@ -383,6 +392,45 @@ class TestProviderDiscovery:
             assert name[0].isupper(), f"Provider class name '{name}' should start with uppercase"
             assert "Provider" in name, f"Provider class '{name}' should contain 'Provider'"
 
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            pytest.param(
+                "from .dynamictileprovider import DynamicTileProvider\nclass ATileProvider(DynamicTileProvider): pass\n",
+                True,
+                id="direct",
+            ),
+            pytest.param(
+                "from .dynamictileprovider import DynamicTileProvider as Base\nclass ATileProvider(Base): pass\n",
+                True,
+                id="aliased_base",
+            ),
+            pytest.param(
+                "from . import dynamictileprovider as dtp\nclass ATileProvider(dtp.DynamicTileProvider): pass\n",
+                True,
+                id="module_attribute",
+            ),
+            pytest.param(
+                "from .ferndynamictileprovider import FernTileProvider\nclass ATileProvider(FernTileProvider): pass\n",
+                True,
+                id="other_provider_module",
+            ),
+            pytest.param("class ATileProvider(object): pass\n", False, id="no_provider"),
+        ],
+    )
+    def test_declares_provider_class(self, tmp_path, source, expected):
+        """
+        Scenario: Recognise provider classes however their base is named
+
+        Given a provider file naming DynamicTileProvider directly, through an alias,
+              through its module or through a provider from another file
+        When the file is parsed for provider classes
+        Then the file should be reported as declaring a provider, unless it has none
+        """
+        filepath = tmp_path / "adynamictileprovider.py"
+        filepath.write_text(source)
+        assert _declares_provider_class(str(filepath)) is expected
+
 
 # =============================================================================
 # USAGE INFORMATION
@@ -421,8 +469,7 @@ ADDING A NEW PROVIDER:
            media_id, tilelevel, row, col = tile_id
 
            # Validate coordinates
-           if row < 0 or col < 0 or \
-              row > 2**tilelevel - 1 or col > 2**tilelevel - 1:
+           if tilelevel < 0 or (row | col) >> tilelevel:
                return
 
            # Generate tile
@@ -15,7 +15,9 @@
 
 import logging
 import tempfile
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
+from unittest.mock import patch
 
 from pyzui.logger import ColoredFormatter, LoggerConfig, get_logger
 
@@ -111,6 +113,36 @@ class TestLoggerConfig:
             assert LoggerConfig._log_file == Path(temp_dir) / "pyzui.log"
             assert LoggerConfig._log_file.parent.exists()
 
+    def test_file_logging_uses_queue(self):
+        """
+        Scenario: File records are written by the listener thread
+
+        Given file logging is enabled
+        When a record is logged and LoggerConfig.flush() is called
+        Then the root logger should hold a QueueHandler rather than the file handler
+        And the record should be in the log file
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            LoggerConfig.initialize(
+                debug=False,
+                log_to_file=True,
+                log_to_console=False,
+                log_dir=temp_dir,
+                colored_output=False,
+                verbose=False,
+            )
+
+            root_handlers = logging.getLogger().handlers
+            assert any(isinstance(handler, QueueHandler) for handler in root_handlers)
+            assert not any(isinstance(handler, RotatingFileHandler) for handler in root_handlers)
+
+            get_logger("QueueTest").warning("queued message")
+            LoggerConfig.flush()
+
+            assert "queued message" in LoggerConfig._log_file.read_text()
+
+            LoggerConfig._stop_listener()
+
     def test_get_logger_auto_initializes(self):
         """
         Scenario: Get logger without explicit initialization
@@ -140,6 +172,24 @@ class TestLoggerConfig:
         assert logger1 is logger2
         assert "TestModule" in LoggerConfig._loggers
 
+    def test_get_logger_cached_skips_initialize(self):
+        """
+        Scenario: Cached logger lookups do not touch initialization
+
+        Given a logger has been requested before
+        When get_logger() is called again with the same name
+        Then initialize() should not be called
+        And the cached logger instance should be returned
+        """
+        logger1 = LoggerConfig.get_logger("TestModule")
+
+        with patch.object(LoggerConfig, "initialize") as mock_initialize:
+            LoggerConfig._initialized = False
+            logger2 = LoggerConfig.get_logger("TestModule")
+
+        mock_initialize.assert_not_called()
+        assert logger1 is logger2
+
     def test_set_level_specific_module(self):
         """
         Scenario: Set log level for specific module
@@ -193,6 +243,31 @@ class TestLoggerConfig:
         # Console level should be updated
         assert LoggerConfig._console_level == logging.DEBUG
 
+    def test_set_level_all_modules_own_handlers_only(self):
+        """
+        Scenario: Global level change is limited to PyZUI's handlers
+
+        Given file logging is enabled and a foreign handler is on the root logger
+        When set_level() is called without module parameter
+        Then the file handler behind the logging queue should be updated
+        And the foreign handler should keep its level
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            LoggerConfig.initialize(
+                debug=False, log_to_file=True, log_to_console=False, log_dir=temp_dir, colored_output=False
+            )
+            foreign = logging.NullHandler(logging.ERROR)
+            logging.getLogger().addHandler(foreign)
+            try:
+                LoggerConfig.set_level(logging.DEBUG)
+
+                assert foreign.level == logging.ERROR
+                for handler in LoggerConfig._listener.handlers:
+                    assert handler.level == logging.DEBUG
+            finally:
+                logging.getLogger().removeHandler(foreign)
+                LoggerConfig._stop_listener()
+
     def test_enable_disable_debug(self):
         """
         Scenario: Enable and disable debug mode at runtime
@@ -447,66 +522,6 @@ class TestColoredFormatter:
         assert "Test message" in formatted
 
 
-class TestColoredFormatter:
-    """
-    Feature: Colored Formatter
-
-    This test suite validates the ColoredFormatter class which adds
-    ANSI color codes to console log output based on log level.
-    """
-
-    def test_format_with_color(self):
-        """
-        Scenario: Format log record with color codes
-
-        Given a log record with WARNING level
-        When ColoredFormatter.format() is called
-        Then it should add color codes to the record
-        """
-        formatter = ColoredFormatter("%(color)s[%(levelname)s]%(reset)s %(message)s")
-
-        # Create a log record
-        record = logging.LogRecord(
-            name="Test", level=logging.WARNING, pathname="test.py", lineno=1, msg="Test message", args=(), exc_info=None
-        )
-
-        formatted = formatter.format(record)
-
-        # Should contain color codes
-        assert "\033[" in formatted
-        assert "[WARNING]" in formatted
-        assert "Test message" in formatted
-
-    def test_format_unknown_level(self):
-        """
-        Scenario: Format log record with unknown level
-
-        Given a log record with custom level
-        When ColoredFormatter.format() is called
-        Then it should not add color codes
-        """
-        formatter = ColoredFormatter("%(color)s[%(levelname)s]%(reset)s %(message)s")
-
-        # Create a log record with custom level
-        record = logging.LogRecord(
-            name="Test",
-            level=15,  # Custom level between DEBUG and INFO
-            pathname="test.py",
-            lineno=1,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
-        record.levelname = "CUSTOM"
-
-        formatted = formatter.format(record)
-
-        # Should not contain color codes for unknown level
-        assert "\033[" not in formatted
-        assert "[CUSTOM]" in formatted
-        assert "Test message" in formatted
-
-
 class TestGetLoggerFunction:
     """
     Feature: get_logger convenience function
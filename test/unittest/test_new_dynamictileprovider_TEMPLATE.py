@@ -24,6 +24,9 @@ USAGE:
 5. Add any provider-specific tests as needed
 6. Run: pytest test_your_provider_name.py
 
+This template itself is listed in conftest.py's collect_ignore, so its
+placeholder tests are not run as part of the suite.
+
 EXAMPLE:
 If you created MandelbrotTileProvider, rename to test_mandelbrottileprovider.py
 and replace all instances of YourProvider with MandelbrotTileProvider.
@@ -342,9 +345,7 @@ class TestYourProviderName:
         OPTIONAL: Add tests for internal methods used in tile generation.
 
         Examples from FernDynamicTileProvider:
-        - __choose_transformation(): Random transformation selection
-        - __transform(x, y): Apply transformation to coordinates
-        - __draw_point(tile, x, y, size): Draw point on tile
+        - __choose_transformations(n): Batched random transformation selection
 
         TODO: Add tests for your provider's helper methods
         """
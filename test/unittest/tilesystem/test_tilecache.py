@@ -324,6 +324,7 @@ class TestTileCache:
         assert tile2_id not in cache
         assert tile3_id in cache
 
+    @pytest.mark.slow
     def test_maxage_expiration(self):
         """
         Scenario: Tiles expire after exceeding maxage
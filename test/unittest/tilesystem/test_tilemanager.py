@@ -262,6 +262,73 @@ class TestTileManager:
         assert result is True
         mock_tilestore.tiled.assert_called_once_with("static_media.jpg")
 
+    @patch("pyzui.tilesystem.tilemanager.TileStore")
+    @patch("pyzui.tilesystem.tilemanager.TileCache")
+    @patch("pyzui.tilesystem.tilemanager.StaticTileProvider")
+    @patch("pyzui.tilesystem.tilemanager.FernTileProvider")
+    def test_tiled_memoized(self, mock_fern, mock_static, mock_cache, mock_tilestore):
+        """
+        Scenario: Repeated tiled checks for tiled media hit the filesystem once
+
+        Given an initialized tile manager and a static media that is tiled
+        When tiled is called 100 times for that media
+        Then TileStore.tiled should only be called once
+        """
+        mock_static.return_value = Mock()
+        mock_fern.return_value = Mock()
+        mock_tilestore.tiled.return_value = True
+
+        tilemanager.init(total_cache_size=1024, auto_cleanup=False)
+
+        for _ in range(100):
+            assert tilemanager.tiled("test.jpg") is True
+        mock_tilestore.tiled.assert_called_once_with("test.jpg")
+
+    @patch("pyzui.tilesystem.tilemanager.TileStore")
+    @patch("pyzui.tilesystem.tilemanager.TileCache")
+    @patch("pyzui.tilesystem.tilemanager.StaticTileProvider")
+    @patch("pyzui.tilesystem.tilemanager.FernTileProvider")
+    def test_tiled_does_not_memoize_untiled(self, mock_fern, mock_static, mock_cache, mock_tilestore):
+        """
+        Scenario: Media still being tiled is re-checked on every call
+
+        Given an initialized tile manager and a static media not yet tiled
+        When tiled is called, the tiler finishes, and tiled is called again
+        Then the second call should return True
+        """
+        mock_static.return_value = Mock()
+        mock_fern.return_value = Mock()
+        mock_tilestore.tiled.return_value = False
+
+        tilemanager.init(total_cache_size=1024, auto_cleanup=False)
+
+        assert tilemanager.tiled("test.jpg") is False
+        mock_tilestore.tiled.return_value = True
+        assert tilemanager.tiled("test.jpg") is True
+
+    @patch("pyzui.tilesystem.tilemanager.TileStore")
+    @patch("pyzui.tilesystem.tilemanager.TileCache")
+    @patch("pyzui.tilesystem.tilemanager.StaticTileProvider")
+    @patch("pyzui.tilesystem.tilemanager.FernTileProvider")
+    def test_clear_tiled_cache(self, mock_fern, mock_static, mock_cache, mock_tilestore):
+        """
+        Scenario: Clearing the tiled cache forces a TileStore check
+
+        Given a static media already confirmed as tiled
+        When clear_tiled_cache is called and tiled is called again
+        Then TileStore.tiled should be consulted a second time
+        """
+        mock_static.return_value = Mock()
+        mock_fern.return_value = Mock()
+        mock_tilestore.tiled.return_value = True
+
+        tilemanager.init(total_cache_size=1024, auto_cleanup=False)
+
+        tilemanager.tiled("test.jpg")
+        tilemanager.clear_tiled_cache()
+        tilemanager.tiled("test.jpg")
+        assert mock_tilestore.tiled.call_count == 2
+
     @patch("pyzui.tilesystem.tilemanager.TileStore")
     @patch("pyzui.tilesystem.tilemanager.TileCache")
     @patch("pyzui.tilesystem.tilemanager.StaticTileProvider")
@@ -0,0 +1,32 @@
+## PyZUI - Python Zooming User Interface
+##
+## This program is free software; you can redistribute it and/or
+## modify it under the terms of the GNU General Public License
+## as published by the Free Software Foundation; either version 3
+## of the License, or (at your option) any later version.
+##
+## This program is distributed in the hope that it will be useful,
+## but WITHOUT ANY WARRANTY; without even the implied warranty of
+## MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+## GNU General Public License for more details.
+##
+## You should have received a copy of the GNU General Public License
+## along with this program; if not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared fixtures for the tile provider unit tests.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture(scope="class")
+def provider(request):
+    """Single provider shared by the tests in a class, built from its ``provider_class``.
+
+    The provider threads are never started and the tests only read from the
+    instance, so one per class is enough; its tile cache is a bare Mock.
+    """
+    return request.cls.provider_class(Mock())
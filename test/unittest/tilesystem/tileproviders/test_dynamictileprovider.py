@@ -26,7 +26,9 @@ class TestDynamicTileProvider:
     inheritance verification, attribute validation, and dynamic tile loading behavior.
     """
 
-    def test_init(self):
+    provider_class = DynamicTileProvider
+
+    def test_init(self, provider):
         """
         Scenario: Initialize DynamicTileProvider with tilecache
 
@@ -34,11 +36,9 @@ class TestDynamicTileProvider:
         When DynamicTileProvider is instantiated
         Then the provider object is created successfully
         """
-        tilecache = Mock()
-        provider = DynamicTileProvider(tilecache)
         assert provider is not None
 
-    def test_inherits_from_tileprovider(self):
+    def test_inherits_from_tileprovider(self, provider):
         """
         Scenario: Verify DynamicTileProvider inheritance
 
@@ -48,8 +48,6 @@ class TestDynamicTileProvider:
         """
         from pyzui.tilesystem.tileproviders import TileProvider
 
-        tilecache = Mock()
-        provider = DynamicTileProvider(tilecache)
         assert isinstance(provider, TileProvider)
 
     def test_filext_attribute(self):
@@ -82,7 +80,7 @@ class TestDynamicTileProvider:
         """
         assert DynamicTileProvider.aspect_ratio == 1.0
 
-    def test_load_dynamic_abstract_method(self):
+    def test_load_dynamic_abstract_method(self, provider):
         """
         Scenario: Call abstract _load_dynamic method
 
@@ -90,8 +88,6 @@ class TestDynamicTileProvider:
         When calling _load_dynamic without overriding it
         Then it should return None
         """
-        tilecache = Mock()
-        provider = DynamicTileProvider(tilecache)
         tile_id = ("media_id", 0, 0, 0)
         result = provider._load_dynamic(tile_id, "/path/to/file")
         assert result is None
@@ -99,7 +95,7 @@ class TestDynamicTileProvider:
     @patch("pyzui.tilesystem.tileproviders.dynamictileprovider.TileStore.get_tile_path")
     @patch("os.path.exists")
     @patch("pyzui.tilesystem.tileproviders.dynamictileprovider.QtGui.QImage")
-    def test_load_existing_tile(self, mock_qimage_class, mock_exists, mock_path):
+    def test_load_existing_tile(self, mock_qimage_class, mock_exists, mock_path, provider):
         """
         Scenario: Load an existing tile from disk
 
@@ -108,9 +104,6 @@ class TestDynamicTileProvider:
         Then the tile image should be loaded from the file path
         And the QImage object should be returned
         """
-        tilecache = Mock()
-        provider = DynamicTileProvider(tilecache)
-
         mock_path.return_value = "/path/to/tile.png"
         mock_exists.return_value = True
         mock_image = Mock()
@@ -127,7 +120,7 @@ class TestDynamicTileProvider:
     @patch("os.path.exists")
     @patch.object(DynamicTileProvider, "_load_dynamic")
     @patch("pyzui.tilesystem.tileproviders.dynamictileprovider.QtGui.QImage")
-    def test_load_nonexistent_tile(self, mock_qimage_class, mock_load_dynamic, mock_exists, mock_path):
+    def test_load_nonexistent_tile(self, mock_qimage_class, mock_load_dynamic, mock_exists, mock_path, provider):
         """
         Scenario: Load a tile that doesn't exist on disk
 
@@ -135,9 +128,6 @@ class TestDynamicTileProvider:
         When calling _load with the tile ID
         Then _load_dynamic should be called to generate the tile
         """
-        tilecache = Mock()
-        provider = DynamicTileProvider(tilecache)
-
         mock_path.return_value = "/path/to/tile.png"
         mock_exists.return_value = False
         mock_image = Mock()
@@ -149,10 +139,36 @@ class TestDynamicTileProvider:
 
         mock_load_dynamic.assert_called_once_with(tile_id, "/path/to/tile.png")
 
+    @patch("pyzui.tilesystem.tileproviders.dynamictileprovider.TileStore.recreate_tile_dir")
+    @patch("pyzui.tilesystem.tileproviders.dynamictileprovider.TileStore.get_tile_path")
+    @patch("os.path.exists")
+    @patch.object(DynamicTileProvider, "_load_dynamic")
+    @patch("pyzui.tilesystem.tileproviders.dynamictileprovider.QtGui.QImage")
+    def test_load_recreates_removed_tile_dir(
+        self, mock_qimage_class, mock_load_dynamic, mock_exists, mock_path, mock_recreate, provider
+    ):
+        """
+        Scenario: Generate a tile whose directory was removed
+
+        Given a tile directory that was removed after get_tile_path created it
+        When _load_dynamic fails to save the tile with FileNotFoundError
+        Then the tile directory should be created again
+        And _load_dynamic should be retried once
+        """
+        mock_path.return_value = "/path/to/tile.png"
+        mock_exists.return_value = False
+        mock_load_dynamic.side_effect = [FileNotFoundError("/path/to/tile.png"), None]
+
+        tile_id = ("media_id", 0, 0, 0)
+        provider._load(tile_id)
+
+        mock_recreate.assert_called_once_with("/path/to/tile.png")
+        assert mock_load_dynamic.call_count == 2
+
     @patch("pyzui.tilesystem.tileproviders.dynamictileprovider.TileStore.get_tile_path")
     @patch("os.path.exists")
     @patch("pyzui.tilesystem.tileproviders.dynamictileprovider.QtGui.QImage", side_effect=Exception("Load error"))
-    def test_load_handles_exception(self, mock_qimage, mock_exists, mock_path):
+    def test_load_handles_exception(self, mock_qimage, mock_exists, mock_path, provider):
         """
         Scenario: Handle exceptions during tile loading
 
@@ -161,9 +177,6 @@ class TestDynamicTileProvider:
         Then the exception should be caught
         And None should be returned
         """
-        tilecache = Mock()
-        provider = DynamicTileProvider(tilecache)
-
         mock_path.return_value = "/path/to/tile.png"
         mock_exists.return_value = True
 
@@ -173,7 +186,7 @@ class TestDynamicTileProvider:
         assert result is None
 
     @patch("pyzui.tilesystem.tileproviders.dynamictileprovider.TileStore.get_tile_path")
-    def test_load_creates_path_with_mkdirp(self, mock_path):
+    def test_load_creates_path_with_mkdirp(self, mock_path, provider):
         """
         Scenario: Create directory structure during tile loading
 
@@ -182,9 +195,6 @@ class TestDynamicTileProvider:
         Then get_tile_path should be called with mkdirp=True
         And the directory structure should be created automatically
         """
-        tilecache = Mock()
-        provider = DynamicTileProvider(tilecache)
-
         mock_path.return_value = "/path/to/tile.png"
 
         tile_id = ("media_id", 0, 0, 0)
@@ -15,6 +15,8 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 from pyzui.tilesystem.tileproviders import FernTileProvider
 
 
@@ -26,7 +28,9 @@ class TestFernTileProvider:
     Barnsley fern fractal tiles on demand using iterated function systems.
     """
 
-    def test_init(self):
+    provider_class = FernTileProvider
+
+    def test_init(self, provider):
         """
         Scenario: Initialize fern tile provider
 
@@ -34,11 +38,9 @@ class TestFernTileProvider:
         When a FernTileProvider is instantiated
         Then it should be successfully created
         """
-        tilecache = Mock()
-        provider = FernTileProvider(tilecache)
         assert provider is not None
 
-    def test_inherits_from_dynamictileprovider(self):
+    def test_inherits_from_dynamictileprovider(self, provider):
         """
         Scenario: Verify inheritance from DynamicTileProvider
 
@@ -48,8 +50,6 @@ class TestFernTileProvider:
         """
         from pyzui.tilesystem.tileproviders import DynamicTileProvider
 
-        tilecache = Mock()
-        provider = FernTileProvider(tilecache)
         assert isinstance(provider, DynamicTileProvider)
 
     def test_filext_attribute(self):
@@ -86,108 +86,98 @@ class TestFernTileProvider:
         """
         Scenario: Verify maximum iterations setting
 
-        Given a FernTileProvider instance
+        Given the FernTileProvider class
         When checking the max_iterations attribute
         Then it should be 50000
         """
-        tilecache = Mock()
-        provider = FernTileProvider(tilecache)
-        assert provider.max_iterations == 50000
+        assert FernTileProvider.max_iterations == 50000
 
     def test_max_points_attribute(self):
         """
         Scenario: Verify maximum points setting
 
-        Given a FernTileProvider instance
+        Given the FernTileProvider class
         When checking the max_points attribute
         Then it should be 10000
         """
-        tilecache = Mock()
-        provider = FernTileProvider(tilecache)
-        assert provider.max_points == 10000
+        assert FernTileProvider.max_points == 10000
 
     def test_transformations_attribute(self):
         """
         Scenario: Verify transformation matrices exist
 
-        Given a FernTileProvider instance
+        Given the FernTileProvider class
         When checking the transformations attribute
         Then it should contain 4 transformation matrices
         """
-        tilecache = Mock()
-        provider = FernTileProvider(tilecache)
-        assert len(provider.transformations) == 4
+        assert len(FernTileProvider.transformations) == 4
 
     def test_color_attribute(self):
         """
         Scenario: Verify fern color configuration
 
-        Given a FernTileProvider instance
+        Given the FernTileProvider class
         When checking the color attribute
         Then it should be green RGB tuple (100, 170, 0)
         """
-        tilecache = Mock()
-        provider = FernTileProvider(tilecache)
-        assert provider.color == (100, 170, 0)
-
-    def test_load_dynamic_negative_row(self):
+        assert FernTileProvider.color == (100, 170, 0)
+
+    @pytest.mark.parametrize(
+        "tile_id",
+        [
+            pytest.param(("fern", 2, -1, 1), id="negative_row"),
+            pytest.param(("fern", 2, 1, -1), id="negative_col"),
+            pytest.param(("fern", 2, 10, 10), id="out_of_range"),
+            pytest.param(("fern", 2, 4, 1), id="row_one_past_last"),
+            pytest.param(("fern", 2, 1, 4), id="col_one_past_last"),
+            pytest.param(("fern", -1, 0, 0), id="negative_tilelevel"),
+        ],
+    )
+    @patch("pyzui.tilesystem.tileproviders.ferndynamictileprovider.Image.new")
+    def test_load_dynamic_invalid_tile(self, mock_image_new, tile_id, provider):
         """
-        Scenario: Handle negative row coordinate
+        Scenario: Reject tiles outside the fern's tile grid
 
         Given a FernTileProvider instance
-        When _load_dynamic is called with a negative row coordinate
+        When _load_dynamic is called with a negative row, column or tilelevel,
+             or a row or column of 2**tilelevel or more
         Then it should return None as the tile is out of bounds
+        And no image should be created
         """
-        tilecache = Mock()
-        provider = FernTileProvider(tilecache)
-        tile_id = ("fern", 2, -1, 1)
-        outfile = "/path/to/tile.png"
-        result = provider._load_dynamic(tile_id, outfile)
+        result = provider._load_dynamic(tile_id, "/path/to/tile.png")
         assert result is None
+        mock_image_new.assert_not_called()
 
-    def test_load_dynamic_negative_col(self):
+    @patch("pyzui.tilesystem.tileproviders.ferndynamictileprovider.Image.new")
+    def test_load_dynamic_last_valid_tile(self, mock_image_new, provider):
         """
-        Scenario: Handle negative column coordinate
+        Scenario: Generate the bottom-right tile at a tile level
 
-        Given a FernTileProvider instance
-        When _load_dynamic is called with a negative column coordinate
-        Then it should return None as the tile is out of bounds
+        Given a FernTileProvider with mocked image creation
+        When _load_dynamic is called with row and col equal to 2**tilelevel - 1
+        Then the tile should be generated and saved
         """
-        tilecache = Mock()
-        provider = FernTileProvider(tilecache)
-        tile_id = ("fern", 2, 1, -1)
+        mock_image = Mock()
+        mock_image_new.return_value = mock_image
+
+        tile_id = ("fern", 2, 3, 3)
         outfile = "/path/to/tile.png"
-        result = provider._load_dynamic(tile_id, outfile)
-        assert result is None
 
-    def test_load_dynamic_out_of_range(self):
-        """
-        Scenario: Handle coordinates beyond valid range
+        provider._load_dynamic(tile_id, outfile)
 
-        Given a FernTileProvider instance
-        When _load_dynamic is called with coordinates outside the valid range
-        Then it should return None as the tile is out of bounds
-        """
-        tilecache = Mock()
-        provider = FernTileProvider(tilecache)
-        tile_id = ("fern", 2, 10, 10)
-        outfile = "/path/to/tile.png"
-        result = provider._load_dynamic(tile_id, outfile)
-        assert result is None
+        mock_image.save.assert_called_once_with(outfile)
 
     @patch("pyzui.tilesystem.tileproviders.ferndynamictileprovider.Image.new")
-    def test_load_dynamic_valid_tile(self, mock_image_new):
+    def test_load_dynamic_valid_tile(self, mock_image_new, provider):
         """
         Scenario: Generate valid fern fractal tile
 
         Given a FernTileProvider with mocked image creation
         When _load_dynamic is called with valid coordinates
         Then a 256x256 RGB image should be created
+        And its pixels should be filled from one 256x256 RGB buffer
         And the image should be saved to the output file
         """
-        tilecache = Mock()
-        provider = FernTileProvider(tilecache)
-
         mock_image = Mock()
         mock_image_new.return_value = mock_image
 
@@ -198,3 +188,5 @@ class TestFernTileProvider:
 
         mock_image.save.assert_called_once_with(outfile)
         mock_image_new.assert_called_once_with("RGB", (256, 256))
+        mock_image.frombytes.assert_called_once()
+        assert len(mock_image.frombytes.call_args.args[0]) == 3 * 256 * 256
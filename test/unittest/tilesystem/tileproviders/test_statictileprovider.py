@@ -13,12 +13,32 @@
 ## You should have received a copy of the GNU General Public License
 ## along with this program; if not, see <https://www.gnu.org/licenses/>.
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
+import pytest
 from PIL import Image
 
 from pyzui.tilesystem.tileproviders import StaticTileProvider
 
+_MODULE = "pyzui.tilesystem.tileproviders.statictileprovider"
+
+
+@pytest.fixture
+def tilestore(monkeypatch):
+    """Stub the tile store lookups and Image.open used by StaticTileProvider._load.
+
+    Returns a Mock whose ``get_metadata``, ``get_tile_path`` and ``image_open``
+    attributes are the replacements. By default the media has a maxtilelevel
+    of 5 and every tile lives at "/path/to/tile.jpg".
+    """
+    stub = Mock()
+    stub.get_metadata.return_value = 5
+    stub.get_tile_path.return_value = "/path/to/tile.jpg"
+    monkeypatch.setattr(f"{_MODULE}.TileStore.get_metadata", stub.get_metadata)
+    monkeypatch.setattr(f"{_MODULE}.TileStore.get_tile_path", stub.get_tile_path)
+    monkeypatch.setattr(f"{_MODULE}.Image.open", stub.image_open)
+    return stub
+
 
 class TestStaticTileProvider:
     """
@@ -28,7 +48,9 @@ class TestStaticTileProvider:
     from the tile store on disk for media that has been previously tiled.
     """
 
-    def test_init(self):
+    provider_class = StaticTileProvider
+
+    def test_init(self, provider):
         """
         Scenario: Initialize a static tile provider
 
@@ -36,11 +58,9 @@ class TestStaticTileProvider:
         When a StaticTileProvider is instantiated
         Then it should be successfully created
         """
-        tilecache = Mock()
-        provider = StaticTileProvider(tilecache)
         assert provider is not None
 
-    def test_inherits_from_tileprovider(self):
+    def test_inherits_from_tileprovider(self, provider):
         """
         Scenario: Verify inheritance from TileProvider
 
@@ -50,14 +70,9 @@ class TestStaticTileProvider:
         """
         from pyzui.tilesystem.tileproviders import TileProvider
 
-        tilecache = Mock()
-        provider = StaticTileProvider(tilecache)
         assert isinstance(provider, TileProvider)
 
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.TileStore.get_metadata")
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.TileStore.get_tile_path")
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.Image.open")
-    def test_load_success(self, mock_open, mock_path, mock_metadata):
+    def test_load_success(self, provider, tilestore):
         """
         Scenario: Successfully load a tile from disk
 
@@ -66,13 +81,8 @@ class TestStaticTileProvider:
         Then the tile image should be loaded from disk
         And the image's load method should be called
         """
-        tilecache = Mock()
-        provider = StaticTileProvider(tilecache)
-
-        mock_metadata.return_value = 5
-        mock_path.return_value = "/path/to/tile.jpg"
         mock_image = Mock(spec=Image.Image)
-        mock_open.return_value = mock_image
+        tilestore.image_open.return_value = mock_image
 
         tile_id = ("media_id", 2, 0, 0)
         result = provider._load(tile_id)
@@ -80,8 +90,7 @@ class TestStaticTileProvider:
         assert result == mock_image
         mock_image.load.assert_called_once()
 
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.TileStore.get_metadata")
-    def test_load_exceeds_maxtilelevel(self, mock_metadata):
+    def test_load_exceeds_maxtilelevel(self, provider, tilestore):
         """
         Scenario: Request tile beyond maximum level
 
@@ -89,19 +98,13 @@ class TestStaticTileProvider:
         When _load is called with a tile_id at level 5
         Then it should return None as the tile is unavailable
         """
-        tilecache = Mock()
-        provider = StaticTileProvider(tilecache)
-
-        mock_metadata.return_value = 3
+        tilestore.get_metadata.return_value = 3
         tile_id = ("media_id", 5, 0, 0)
         result = provider._load(tile_id)
 
         assert result is None
 
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.TileStore.get_metadata")
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.TileStore.get_tile_path")
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.Image.open")
-    def test_load_ioerror(self, mock_open, mock_path, mock_metadata):
+    def test_load_ioerror(self, provider, tilestore):
         """
         Scenario: Handle missing tile file
 
@@ -109,22 +112,14 @@ class TestStaticTileProvider:
         When _load is called and the tile file is not found
         Then it should catch the IOError and return None
         """
-        tilecache = Mock()
-        provider = StaticTileProvider(tilecache)
-
-        mock_metadata.return_value = 5
-        mock_path.return_value = "/path/to/tile.jpg"
-        mock_open.side_effect = OSError("File not found")
+        tilestore.image_open.side_effect = OSError("File not found")
 
         tile_id = ("media_id", 2, 0, 0)
         result = provider._load(tile_id)
 
         assert result is None
 
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.TileStore.get_metadata")
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.TileStore.get_tile_path")
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.Image.open")
-    def test_load_valid_tilelevel(self, mock_open, mock_path, mock_metadata):
+    def test_load_valid_tilelevel(self, provider, tilestore):
         """
         Scenario: Load tile at maximum level boundary
 
@@ -132,23 +127,15 @@ class TestStaticTileProvider:
         When _load is called with a tile_id at exactly level 5
         Then the tile should be successfully loaded
         """
-        tilecache = Mock()
-        provider = StaticTileProvider(tilecache)
-
-        mock_metadata.return_value = 5
-        mock_path.return_value = "/path/to/tile.jpg"
         mock_image = Mock(spec=Image.Image)
-        mock_open.return_value = mock_image
+        tilestore.image_open.return_value = mock_image
 
         tile_id = ("media_id", 5, 0, 0)
         result = provider._load(tile_id)
 
         assert result == mock_image
 
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.TileStore.get_metadata")
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.TileStore.get_tile_path")
-    @patch("pyzui.tilesystem.tileproviders.statictileprovider.Image.open")
-    def test_load_calls_correct_methods(self, mock_open, mock_path, mock_metadata):
+    def test_load_calls_correct_methods(self, provider, tilestore):
         """
         Scenario: Verify tile store interaction
 
@@ -158,17 +145,12 @@ class TestStaticTileProvider:
         And it should call get_tile_path with the tile_id
         And it should open the image file at the retrieved path
         """
-        tilecache = Mock()
-        provider = StaticTileProvider(tilecache)
-
-        mock_metadata.return_value = 5
-        mock_path.return_value = "/path/to/tile.jpg"
         mock_image = Mock(spec=Image.Image)
-        mock_open.return_value = mock_image
+        tilestore.image_open.return_value = mock_image
 
         tile_id = ("media_id", 2, 3, 4)
         provider._load(tile_id)
 
-        mock_metadata.assert_called_once_with("media_id", "maxtilelevel")
-        mock_path.assert_called_once_with(tile_id)
-        mock_open.assert_called_once_with("/path/to/tile.jpg")
+        tilestore.get_metadata.assert_called_once_with("media_id", "maxtilelevel")
+        tilestore.get_tile_path.assert_called_once_with(tile_id)
+        tilestore.image_open.assert_called_once_with("/path/to/tile.jpg")
@@ -21,6 +21,12 @@ from pyzui.tilesystem.tile import Tile
 from pyzui.tilesystem.tileproviders import TileProvider
 
 
+class _StubCache:
+    """Stand-in tile cache for tests that never start the provider thread, so the cache is never touched."""
+
+    __slots__ = ()
+
+
 def wait_for_cache(cache, tile_ids, timeout=5.0):
     """Poll until all tile_ids appear in cache, or timeout.
 
@@ -53,7 +59,7 @@ class TestTileProvider:
         When a TileProvider is instantiated
         Then it should be created as a daemon thread
         """
-        tilecache = Mock()
+        tilecache = _StubCache()
         provider = TileProvider(tilecache)
         assert isinstance(provider, Thread)
         assert provider.daemon is True
@@ -66,7 +72,7 @@ class TestTileProvider:
         When a TileProvider is instantiated
         Then it should be an instance of Thread
         """
-        tilecache = Mock()
+        tilecache = _StubCache()
         provider = TileProvider(tilecache)
         assert isinstance(provider, Thread)
 
@@ -78,7 +84,7 @@ class TestTileProvider:
         When a tile is requested with a specific tile_id
         Then the tile_id should be added to the internal task queue
         """
-        tilecache = Mock()
+        tilecache = _StubCache()
         provider = TileProvider(tilecache)
         tile_id = ("media_id", 0, 0, 0)
         provider.request(tile_id)
@@ -92,7 +98,7 @@ class TestTileProvider:
         When multiple tiles are requested with different tile_ids
         Then all tile_ids should be added to the internal task queue
         """
-        tilecache = Mock()
+        tilecache = _StubCache()
         provider = TileProvider(tilecache)
         tile_id1 = ("media_id1", 0, 0, 0)
         tile_id2 = ("media_id2", 1, 1, 1)
@@ -108,7 +114,7 @@ class TestTileProvider:
         When the _load method is called with a tile_id
         Then it should return None as it is an abstract method
         """
-        tilecache = Mock()
+        tilecache = _StubCache()
         provider = TileProvider(tilecache)
         tile_id = ("media_id", 0, 0, 0)
         result = provider._load(tile_id)
@@ -122,7 +128,7 @@ class TestTileProvider:
         When purge is called without a media_id
         Then all tasks should be cleared from the queue
         """
-        tilecache = Mock()
+        tilecache = _StubCache()
         provider = TileProvider(tilecache)
         provider.request(("media_id1", 0, 0, 0))
         provider.request(("media_id2", 1, 1, 1))
@@ -137,7 +143,7 @@ class TestTileProvider:
         When purge is called with a specific media_id
         Then only tasks for that media_id should be removed
         """
-        tilecache = Mock()
+        tilecache = _StubCache()
         provider = TileProvider(tilecache)
         provider.request(("media_id1", 0, 0, 0))
         provider.request(("media_id2", 1, 1, 1))
@@ -152,7 +158,7 @@ class TestTileProvider:
         When str() is called on the provider
         Then it should return 'TileProvider'
         """
-        tilecache = Mock()
+        tilecache = _StubCache()
         provider = TileProvider(tilecache)
         assert str(provider) == "TileProvider"
 
@@ -164,7 +170,7 @@ class TestTileProvider:
         When repr() is called on the provider
         Then it should return 'TileProvider()'
         """
-        tilecache = Mock()
+        tilecache = _StubCache()
         provider = TileProvider(tilecache)
         assert repr(provider) == "TileProvider()"
 
@@ -216,7 +222,7 @@ class TestTileProvider:
         When checking its daemon attribute
         Then it should be True
         """
-        tilecache = Mock()
+        tilecache = _StubCache()
         provider = TileProvider(tilecache)
         assert provider.daemon is True
 
@@ -13,9 +13,11 @@
 ## You should have received a copy of the GNU General Public License
 ## along with this program; if not, see <https://www.gnu.org/licenses/>.
 
+import os
 from threading import Thread
 from unittest.mock import Mock, patch
 
+from pyzui.tilesystem import tilestore
 from pyzui.tilesystem.tiler.tiler import Tiler
 
 
@@ -186,6 +188,38 @@ class TestTiler:
         assert tiler._Tiler__filext == "png"
 
 
+class TestTilerSaveTile:
+    """
+    Feature: Tile Saving
+
+    This test suite validates how the Tiler writes tiles into the tilestore.
+    """
+
+    def test_savetile_recreates_removed_tile_dir(self, tmp_path):
+        """
+        Scenario: Save a tile whose directory was removed
+
+        Given a tile directory that was removed after get_tile_path created it
+        When a tile is saved and the first save fails
+        Then the tile directory should be created again
+        And the save should be retried once
+        """
+        tilestore.clear_created_dirs()
+        tiler = Tiler("input.jpg", media_id="test_id")
+        tiler._Tiler__outpath = str(tmp_path)
+        tiler._Tiler__numtiles = 1
+        tile_dir = os.path.dirname(tilestore.get_tile_path(("test_id", 0, 0, 0), True, str(tmp_path), "jpg"))
+        os.rmdir(tile_dir)
+
+        tile = Mock()
+        tile.save.side_effect = [False, True]
+        tiler._Tiler__savetile(tile, 0, 0, 0)
+
+        assert tile.save.call_count == 2
+        assert os.path.isdir(tile_dir)
+        tilestore.clear_created_dirs()
+
+
 class TestTilerCalculations:
     """
     Feature: Tiler Calculation Methods
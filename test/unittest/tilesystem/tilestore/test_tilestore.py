@@ -14,6 +14,8 @@
 ## along with this program; if not, see <https://www.gnu.org/licenses/>.
 
 import hashlib
+import os
+import threading
 from unittest.mock import Mock, mock_open, patch
 
 from pyzui.tilesystem import tilestore
@@ -99,6 +101,21 @@ class TestTilestoreModule:
         path = tilestore.get_media_path(media_id)
         assert expected_hash in path
 
+    def test_get_media_path_follows_tile_dir(self):
+        """
+        Scenario: Memoized hash does not pin the tilestore directory
+
+        Given a media_id whose path has already been computed
+        When tile_dir is changed and get_media_path is called again
+        Then the returned path should be under the new tile_dir
+        """
+        media_id = "test_media"
+        tilestore.get_media_path(media_id)
+        with patch("pyzui.tilesystem.tilestore.tilestore.tile_dir", "/custom/tilestore"):
+            path = tilestore.get_media_path(media_id)
+        expected_hash = hashlib.sha1(media_id.encode("utf-8")).hexdigest()
+        assert path == os.path.join("/custom/tilestore", expected_hash)
+
     def test_get_tile_path_basic(self):
         """
         Scenario: Get basic tile file path
@@ -151,10 +168,94 @@ class TestTilestoreModule:
         When get_tile_path is called with mkdirp=True
         Then the necessary directories should be created
         """
+        tilestore.clear_created_dirs()
         tile_id = ("media_id", 0, 0, 0)
         tilestore.get_tile_path(tile_id, mkdirp=True, filext="jpg")
         mock_makedirs.assert_called_once()
 
+    @patch("os.makedirs")
+    def test_get_tile_path_mkdirp_once_per_dir(self, mock_makedirs):
+        """
+        Scenario: Create each tile directory only once
+
+        Given tiles that share a row directory
+        When get_tile_path is called with mkdirp=True for each of them
+        Then the directory should only be created for the first tile
+        """
+        tilestore.clear_created_dirs()
+        for col in range(3):
+            tilestore.get_tile_path(("media_id", 1, 0, col), mkdirp=True, prefix="/custom/path", filext="jpg")
+        mock_makedirs.assert_called_once()
+
+        tilestore.get_tile_path(("media_id", 1, 1, 0), mkdirp=True, prefix="/custom/path", filext="jpg")
+        assert mock_makedirs.call_count == 2
+
+    @patch("os.makedirs")
+    def test_clear_created_dirs_prefix(self, mock_makedirs):
+        """
+        Scenario: Forget created directories under a deleted media path
+
+        Given tile directories created for two media paths
+        When clear_created_dirs is called with one media path
+        Then only that media's directories should be created again
+        """
+        tilestore.clear_created_dirs()
+        tile_id = ("media_id", 0, 0, 0)
+        tilestore.get_tile_path(tile_id, mkdirp=True, prefix="/custom/a", filext="jpg")
+        tilestore.get_tile_path(tile_id, mkdirp=True, prefix="/custom/ab", filext="jpg")
+        assert mock_makedirs.call_count == 2
+
+        tilestore.clear_created_dirs("/custom/a")
+        tilestore.get_tile_path(tile_id, mkdirp=True, prefix="/custom/a", filext="jpg")
+        tilestore.get_tile_path(tile_id, mkdirp=True, prefix="/custom/ab", filext="jpg")
+        assert mock_makedirs.call_count == 3
+
+        tilestore.clear_created_dirs()
+
+    @patch("os.makedirs")
+    def test_clear_created_dirs_while_adding(self, mock_makedirs):
+        """
+        Scenario: Forget a media path's directories while another thread creates tiles
+
+        Given a thread creating tile directories under one media path
+        When clear_created_dirs is called repeatedly for that media path meanwhile
+        Then no call should fail because the directory set changed size
+        """
+        tilestore.clear_created_dirs()
+        done = threading.Event()
+
+        def add_dirs():
+            for row in range(20000):
+                tilestore.get_tile_path(("media_id", 1, row, 0), mkdirp=True, prefix="/custom/a", filext="jpg")
+            done.set()
+
+        thread = threading.Thread(target=add_dirs)
+        thread.start()
+        try:
+            while not done.is_set():
+                tilestore.clear_created_dirs("/custom/a")
+        finally:
+            thread.join()
+            tilestore.clear_created_dirs()
+
+    def test_recreate_tile_dir(self, tmp_path):
+        """
+        Scenario: Recreate a tile directory removed behind the tilestore's back
+
+        Given a tile directory created by get_tile_path with mkdirp=True
+        And the directory has since been removed from disk
+        When recreate_tile_dir is called with the tile's path
+        Then the directory should exist again
+        """
+        tilestore.clear_created_dirs()
+        path = tilestore.get_tile_path(("media_id", 1, 0, 0), mkdirp=True, prefix=str(tmp_path), filext="jpg")
+        os.rmdir(os.path.dirname(path))
+
+        tilestore.recreate_tile_dir(path)
+
+        assert os.path.isdir(os.path.dirname(path))
+        tilestore.clear_created_dirs()
+
     @patch("builtins.open", new_callable=mock_open, read_data="width\t100\tint\nheight\t200\tint\n")
     @patch("os.path.join")
     def test_load_metadata_success(self, mock_join, mock_file):
@@ -33,13 +33,3 @@ class TestDialogWindows:
         import pyzui.windows.dialogwindows.dialogwindows
 
         assert pyzui.windows.dialogwindows.dialogwindows is not None
-
-    def test_placeholder(self):
-        """
-        Scenario: Placeholder test for future implementation
-
-        Given the test suite structure
-        When running placeholder tests
-        Then they should pass to maintain test suite integrity
-        """
-        assert True
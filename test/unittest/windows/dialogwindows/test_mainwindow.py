@@ -37,16 +37,6 @@ class TestMainWindow:
 
         assert pyzui.windows.mainwindow is not None
 
-    def test_placeholder(self):
-        """
-        Scenario: Placeholder test for future implementation
-
-        Given the test suite structure
-        When running placeholder tests
-        Then they should pass to maintain test suite integrity
-        """
-        assert True
-
 
 class TestSupportedExtensions:
     """